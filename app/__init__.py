@@ -26,6 +26,9 @@ Classes:
 Dependencies:
     - Flask: Web framework.
     - logging: Application logging.
+    - queue: Hands log records to a background listener thread.
+    - atexit: Flushes queued log records on shutdown.
+    - os: Restarts the log listener in forked worker processes.
 
 Custom Filters:
     - nl2br: Converts newlines in a string to HTML line breaks.
@@ -44,6 +47,10 @@ Custom Imports:
 
 # Standard library imports
 import logging
+import logging.handlers
+import queue
+import atexit
+import os
 from flask import Flask
 
 # Custom imports
@@ -131,16 +138,41 @@ stream_handler = logging.StreamHandler()
 stream_handler.setFormatter(console_formatter)
 
 # Configure root logger
+#   Request threads only put records on a queue, a background listener
+#   thread does the file and console I/O
+log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=level,
     handlers=[
-        file_handler,
-        stream_handler
+        logging.handlers.QueueHandler(log_queue)
     ]
 )
 logger = logging.getLogger(__name__)
 
 
+def start_log_listener() -> None:
+    """
+    Start a background thread that writes queued log records.
+
+    Threads do not survive a fork, so this is also called in each
+        forked worker process (eg, uWSGI workers).
+    """
+
+    global log_listener
+    log_listener = logging.handlers.QueueListener(
+        log_queue,
+        file_handler,
+        stream_handler,
+        respect_handler_level=True,
+    )
+    log_listener.start()
+
+
+start_log_listener()
+os.register_at_fork(after_in_child=start_log_listener)
+atexit.register(lambda: log_listener.stop())
+
+
 # Define the custom filter
 def nl2br(
     value
@@ -215,7 +215,7 @@ def add_video_metadata() -> Response:
         speaker_name = request.args.get("speaker_name", None)
         character_name = request.args.get("character_name", None)
 
-        with DatabaseContext() as db:
+        with DatabaseContext(read_only=True) as db:
             if video_name:
                 video_mgr = VideoManager(db)
                 video_id = video_mgr.name_to_id(
@@ -442,174 +442,89 @@ def add_video_metadata() -> Response:
                     return api_error("Failed to update video URL", 500)
 
             # Add tags if provided
+            #   New ones are created, and all are linked in one commit
             if tag_name is not None:
                 tag_mgr = TagManager(db)
 
-                # Go through each tag name and resolve it to an ID
-                for tag in tag_name:
-                    # Get the tag ID from the database
-                    tag_id = tag_mgr.name_to_id(
-                        name=tag,
-                    )
-
-                    # If the tag does not exist, create it
-                    if tag_id is None:
-                        logging.warning(f"Creating new tag: {tag}")
-                        tag_id = tag_mgr.add(
-                            name=tag,
-                        )
-
-                    # Add the tag to the video
-                    if tag_id is None:
-                        logging.error(f"Failed to create tag: {tag}")
-                        return api_error(f"Failed to create tag: {tag}", 500)
+                logging.info(
+                    f"Adding tags {tag_name} to video ID: {video_id}"
+                )
 
-                    logging.info(
-                        f"Adding tag '{tag}' with ID {tag_id} "
-                        f"to video ID: {video_id}"
-                    )
+                result = tag_mgr.add_many_to_video_by_name(
+                    video_id=video_id,
+                    names=tag_name,
+                )
 
-                    result = tag_mgr.add_to_video(
-                        video_id=video_id,
-                        tag_id=tag_id,
+                if not result:
+                    logging.error(
+                        f"Failed to add tags {tag_name} "
+                        f"for video ID: {video_id}"
                     )
-
-                    if not result:
-                        logging.error(
-                            f"Failed to add tag {tag} for video ID: {video_id}"
-                        )
-                        return api_error("Failed to add video tags", 500)
+                    return api_error("Failed to add video tags", 500)
 
             # Add locations if provided
+            #   New ones are created, and all are linked in one commit
             if location_name is not None:
                 loc_mgr = LocationManager(db)
 
-                # Go through each location name and resolve it to an ID
-                for location in location_name:
-                    # Get the location ID from the database
-                    location_id = loc_mgr.name_to_id(
-                        name=location,
-                    )
-
-                    # If the tag does not exist, create it
-                    if location_id is None:
-                        logging.warning(f"Creating new location: {location}")
-                        location_id = loc_mgr.add(
-                            name=location,
-                        )
-
-                    # Add the location to the video
-                    if location_id is None:
-                        logging.error(f"Failed to create location: {location}")
-                        return api_error(
-                            f"Failed to create location: {location}",
-                            500
-                        )
+                logging.info(
+                    f"Adding locations {location_name} to video ID: {video_id}"
+                )
 
-                    logging.info(
-                        f"Adding location '{location}' with ID {location_id} "
-                        f"to video ID: {video_id}"
-                    )
+                result = loc_mgr.add_many_to_video_by_name(
+                    video_id=video_id,
+                    names=location_name,
+                )
 
-                    result = loc_mgr.add_to_video(
-                        video_id=video_id,
-                        location_id=location_id,
+                if not result:
+                    logging.error(
+                        f"Failed to add locations {location_name} "
+                        f"for video ID: {video_id}"
                     )
-
-                    if not result:
-                        logging.error(
-                            f"Failed to add location {location} "
-                            f"for video ID: {video_id}"
-                        )
-                        return api_error("Failed to add video locations", 500)
+                    return api_error("Failed to add video locations", 500)
 
             # Add speakers if provided
+            #   New ones are created, and all are linked in one commit
             if speaker_name is not None:
                 speaker_mgr = SpeakerManager(db)
 
-                # Go through each speaker name and resolve it to an ID
-                for speaker in speaker_name:
-                    # Get the speaker ID from the database
-                    speaker_id = speaker_mgr.name_to_id(
-                        name=speaker,
-                    )
-
-                    # If the speaker does not exist, create it
-                    if speaker_id is None:
-                        logging.warning(f"Creating new speaker: {speaker}")
-                        speaker_id = speaker_mgr.add(
-                            name=speaker,
-                        )
-
-                    # Add the speaker to the video
-                    if speaker_id is None:
-                        logging.error(f"Failed to create speaker: {speaker}")
-                        return api_error(
-                            f"Failed to create speaker: {speaker}",
-                            500
-                        )
+                logging.info(
+                    f"Adding speakers {speaker_name} to video ID: {video_id}"
+                )
 
-                    logging.info(
-                        f"Adding speaker '{speaker}' with ID {speaker_id} "
-                        f"to video ID: {video_id}"
-                    )
+                result = speaker_mgr.add_many_to_video_by_name(
+                    video_id=video_id,
+                    names=speaker_name,
+                )
 
-                    result = speaker_mgr.add_to_video(
-                        video_id=video_id,
-                        speaker_id=speaker_id,
+                if not result:
+                    logging.error(
+                        f"Failed to add speakers {speaker_name} "
+                        f"for video ID: {video_id}"
                     )
-
-                    if not result:
-                        logging.error(
-                            f"Failed to add speaker {speaker} for "
-                            f"video ID: {video_id}"
-                        )
-                        return api_error("Failed to add video speakers", 500)
+                    return api_error("Failed to add video speakers", 500)
 
             # Add characters if provided
+            #   New ones are created, and all are linked in one commit
             if character_name is not None:
                 character_mgr = CharacterManager(db)
 
-                # Go through each character name and resolve it to an ID
-                for character in character_name:
-                    # Get the character ID from the database
-                    character_id = character_mgr.name_to_id(
-                        name=character,
-                    )
-
-                    # If the character does not exist, create it
-                    if character_id is None:
-                        logging.warning(f"Creating new character: {character}")
-                        character_id = character_mgr.add(
-                            name=character,
-                        )
-
-                    # Add the character to the video
-                    if character_id is None:
-                        logging.error(
-                            f"Failed to create character: {character}"
-                        )
-                        return api_error(
-                            f"Failed to create character: {character}",
-                            500
-                        )
+                logging.info(
+                    f"Adding characters {character_name} "
+                    f"to video ID: {video_id}"
+                )
 
-                    logging.info(
-                        f"Adding character '{character}' with ID "
-                        f"{character_id} to video ID: {video_id}"
-                    )
+                result = character_mgr.add_many_to_video_by_name(
+                    video_id=video_id,
+                    names=character_name,
+                )
 
-                    result = character_mgr.add_to_video(
-                        video_id=video_id,
-                        character_id=character_id,
+                if not result:
+                    logging.error(
+                        f"Failed to add characters {character_name} "
+                        f"for video ID: {video_id}"
                     )
-
-                    if not result:
-                        logging.error(
-                            f"Failed to add character {character} for "
-                            f"video ID: {video_id}"
-                        )
-                        return api_error("Failed to add video characters", 500)
+                    return api_error("Failed to add video characters", 500)
 
             # Add scripture if provided
             if scripture_name is not None:
@@ -644,41 +559,19 @@ def add_video_metadata() -> Response:
                             400
                         )
 
-                    # Get the scripture ID from the database
-                    scripture_id = scripture_mgr.name_to_id(
-                        book=book,
-                        chapter=chapter,
-                        verse=verse,
-                    )
-
-                    # If the scripture does not exist, create it
-                    if scripture_id is None:
-                        logging.warning(f"Creating new scripture: {scripture}")
-                        scripture_id = scripture_mgr.add(
-                            book=book,
-                            chapter=chapter,
-                            verse=verse,
-                        )
-
-                    if scripture_id is None:
-                        logging.error(
-                            f"Failed to create scripture: {scripture}"
-                        )
-                        return api_error(
-                            f"Failed to create scripture: {scripture}",
-                            500
-                        )
-
                     # Add the scripture to the video
+                    #   It's created if needed and linked in one commit
                     logging.info(
                         f"Adding scripture '{scripture}' "
                         f"(book: {book}, chapter: {chapter}, verse: {verse}) "
-                        f"with ID {scripture_id} to video ID: {video_id}"
+                        f"to video ID: {video_id}"
                     )
 
-                    result = scripture_mgr.add_to_video(
+                    result = scripture_mgr.add_to_video_by_reference(
                         video_id=video_id,
-                        scripture_id=scripture_id,
+                        book=book,
+                        chapter=chapter,
+                        verse=verse,
                     )
 
                     if not result:
@@ -866,35 +759,37 @@ def add_videos() -> Response:
                 logging.error(f"Invalid duration format: {duration}")
                 return api_error("Invalid duration format", 400)
 
-        # Add the video to the database
-        video_id = video_mgr.add(
-            name=video_name,
-            url=video_url,
-            url_1080=url_1080,
-            url_720=url_720,
-            url_480=url_480,
-            url_360=url_360,
-            url_240=url_240,
-            thumbnail=thumbnail,
-            duration=duration,
-            date_added=today,
-        )
-
-        if video_id is None:
-            logging.error(
-                f"Failed to add video '{video_name}' to the database."
+        # Add the video and link its categories in one transaction
+        with db.transaction():
+            # Add the video to the database
+            video_id = video_mgr.add(
+                name=video_name,
+                url=video_url,
+                url_1080=url_1080,
+                url_720=url_720,
+                url_480=url_480,
+                url_360=url_360,
+                url_240=url_240,
+                thumbnail=thumbnail,
+                duration=duration,
+                date_added=today,
             )
-            return api_error(f"Failed to add video '{video_name}'", 500)
 
-        # Add the categories to the video
-        main_result = cat_mgr.add_to_video(
-            video_id=video_id,
-            category_id=main_cat_id,
-        )
-        sub_result = cat_mgr.add_to_video(
-            video_id=video_id,
-            category_id=sub_cat_id,
-        )
+            if video_id is None:
+                logging.error(
+                    f"Failed to add video '{video_name}' to the database."
+                )
+                return api_error(f"Failed to add video '{video_name}'", 500)
+
+            # Add the categories to the video
+            main_result = cat_mgr.add_to_video(
+                video_id=video_id,
+                category_id=main_cat_id,
+            )
+            sub_result = cat_mgr.add_to_video(
+                video_id=video_id,
+                category_id=sub_cat_id,
+            )
 
         cat_str = ""
         if not main_result:
@@ -947,7 +842,7 @@ def search_videos() -> Response:
         return api_success(data=[])
 
     # Use the search method to find videos
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         video_mgr = VideoManager(db)
         videos = video_mgr.search(
             query=query,
@@ -1009,7 +904,7 @@ def advanced_search() -> Response:
         return api_error("Invalid ID format", 400)
 
     # Build the search query
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         video_mgr = VideoManager(db)
 
         # Build filter kwargs for get_filter method
@@ -1116,7 +1011,7 @@ def add_scripture_text() -> Response:
         )
 
     # Get the scripture ID from the database
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         scripture_mgr = ScriptureManager(db)
 
         # Check if the scripture already exists
@@ -1192,7 +1087,7 @@ def category_filter(
 
     # Select all videos with the given category ID and subcategory ID
     cat_list = [category_id, subcategory_id]
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         video_mgr = VideoManager(db)
         videos = video_mgr.get_filter(
             category_id=cat_list,
@@ -190,7 +190,7 @@ class ProfileManager:
             profile_id = self.db.cursor.lastrowid
             self.db.conn.commit()
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logging.error(f"Error adding profile: {e}")
             self.db.conn.rollback()
             return -1
@@ -222,7 +222,7 @@ class ProfileManager:
                     profiles = cursor.fetchall()
                     return [dict(profile) for profile in profiles]
 
-            except Exception as e:
+            except sqlite3.Error as e:
                 logging.error(f"Error retrieving profiles: {e}")
                 return None
 
@@ -237,7 +237,7 @@ class ProfileManager:
                     profile = cursor.fetchone()
                     return [dict(profile)] if profile else None
 
-            except Exception as e:
+            except sqlite3.Error as e:
                 logging.error(f"Error retrieving profile {profile_id}: {e}")
                 return None
 
@@ -296,7 +296,7 @@ class ProfileManager:
                 cursor.execute(update_query, params)
                 self.db.conn.commit()
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logging.error(f"Error updating profile {profile_id}: {e}")
             self.db.conn.rollback()
             return None
@@ -330,7 +330,7 @@ class ProfileManager:
                 )
                 self.db.conn.commit()
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logging.error(f"Error deleting profile {profile_id}: {e}")
             self.db.conn.rollback()
             return None
@@ -375,7 +375,7 @@ class ProfileManager:
                 history = cursor.fetchall()
                 history_list = [dict(history) for history in history]
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logging.error(
                 f"Error retrieving watch history for profile {profile_id}: {e}"
             )
@@ -398,7 +398,7 @@ class ProfileManager:
                     if 'updated_at' in video:
                         video['watched_at'] = video.pop('updated_at')
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logging.error(
                 f"Error retrieving in-progress videos for profile "
                 f"{profile_id}: {e}"
@@ -464,7 +464,7 @@ class ProfileManager:
                 self.db.conn.commit()
                 return True
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logging.error(
                 f"Error marking video {video_id} as watched for "
                 f"profile {profile_id}: {e}"
@@ -501,7 +501,7 @@ class ProfileManager:
                 self.db.conn.commit()
                 return True
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logging.error(
                 f"Error marking video {video_id} as unwatched for "
                 f"profile {profile_id}: {e}"
@@ -537,7 +537,7 @@ class ProfileManager:
                 )
                 return cursor.fetchone() is not None
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logging.error(
                 f"Error checking if video {video_id} is watched for "
                 f"profile {profile_id}: {e}"
@@ -602,7 +602,7 @@ class ProfileManager:
                 self.db.conn.commit()
                 return True
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logging.error(
                 f"Error removing watch history for profile {profile_id}: {e}"
             )
@@ -666,7 +666,7 @@ class ProgressManager:
                 )
             self.db.conn.commit()
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logging.error(
                 f"[ProgressManager.create] Error adding profile: {e}"
             )
@@ -718,7 +718,7 @@ class ProgressManager:
                     videos = cursor.fetchall()
                     return [dict(videos) for videos in videos]
 
-            except Exception as e:
+            except sqlite3.Error as e:
                 logging.error(
                     f"[ProfileManager.read] "
                     f"Error retrieving in progress videos: {e}"
@@ -740,7 +740,7 @@ class ProgressManager:
                     video = cursor.fetchone()
                     return [dict(video)] if video else None
 
-            except Exception as e:
+            except sqlite3.Error as e:
                 logging.error(
                     f"[ProfileManager.read] Error retrieving video "
                     f"{video_id}: {e}"
@@ -791,7 +791,7 @@ class ProgressManager:
                     (profile_id, video_id, current_time)
                 )
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logging.error(
                 f"[ProfileManager.update] Error updating progress on video "
                 f"{video_id} for profile {profile_id}: {e}"
@@ -838,7 +838,7 @@ class ProgressManager:
                 self.db.conn.commit()
                 return cursor.rowcount > 0
 
-        except Exception as e:
+        except sqlite3.Error as e:
             logging.error(
                 f"[ProfileManager.update] Error deleting in progress entry "
                 f" for video {video_id} on profile {profile_id}: {e}"
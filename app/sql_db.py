@@ -35,39 +35,639 @@ Dependencies:
     - sqlite3: For SQLite database operations.
     - traceback: For handling exceptions and tracebacks.
     - logging: For logging messages and errors.
+    - os: For detecting a forked process.
+    - threading: For keeping one connection per thread.
+    - pathlib: For building read-only database URIs.
+    - functools: For caching generated SQL.
+    - itertools: For flattening bulk insert parameters.
+    - json: For passing lists of IDs to SQLite as one parameter.
+    - contextlib: For the transaction context manager.
+    - weakref: For tracking open cursors on pooled connections.
 """
 
 
 import sqlite3
 import traceback
 import logging
+import os
+import threading
+from pathlib import Path
+import functools
+import itertools
+import json
+import contextlib
+import weakref
+from collections import defaultdict
+from typing import Callable, Iterator
+
+
+logger = logging.getLogger(__name__)
+
+# Most SQLite builds allow at least this many bound parameters per query
+MAX_QUERY_PARAMS = 999
+
+
+def _nonblank(
+    value: object,
+) -> bool:
+    """
+    Checks that a value is a string with something other than whitespace.
+        Unlike 'value.strip()', this doesn't build a new string.
+
+    Args:
+        value (object): The value to check.
+
+    Returns:
+        bool: True if the value is a non-blank string.
+    """
+
+    return isinstance(value, str) and bool(value) and not value.isspace()
+
+
+def _ids_by_name(
+    cursor: sqlite3.Cursor,
+    table: str,
+    names: list[str],
+) -> dict[str, int]:
+    """
+    Looks up the IDs for a list of names in a table.
+        The names are passed as one JSON parameter, so the SQL text is
+        the same for any number of names, and the connection's
+        statement cache can reuse it.
+
+    Args:
+        cursor (sqlite3.Cursor): The cursor to run the query on.
+        table (str): The table to search. This must not be user input.
+        names (list[str]): The names to look up.
+
+    Returns:
+        dict[str, int]:
+            A mapping of name to ID. Names not found are left out.
+    """
+
+    cursor.execute(
+        f"""
+        SELECT name, id FROM {table}
+        WHERE name IN (SELECT value FROM json_each(?))
+        """,
+        (json.dumps(list(dict.fromkeys(names))),)
+    )
+
+    return dict(cursor.fetchall())
+
+
+def _link_by_name(
+    cursor: sqlite3.Cursor,
+    table: str,
+    junction: str,
+    column: str,
+    video_id: int,
+    name: str,
+    item_id: int | None = None,
+) -> int:
+    """
+    Links an item to a video by the item's name.
+        The item is added to its table if it doesn't exist yet.
+        Run this inside a transaction, so both writes commit together.
+
+    Args:
+        cursor (sqlite3.Cursor): The cursor to run the statements on.
+        table (str): The item table, such as 'tags'.
+            This must not be user input.
+        junction (str): The junction table, such as 'videos_tags'.
+            This must not be user input.
+        column (str): The item's column in the junction table.
+            This must not be user input.
+        video_id (int): The ID of the video to link to.
+        name (str): The name of the item.
+        item_id (int | None): The item's ID, if the caller already
+            knows it. Skips the lookup. Defaults to None.
+
+    Returns:
+        int: The ID of the item.
+    """
+
+    # The no-op update on conflict makes RETURNING give the ID,
+    #   whether it was just added or already existed
+    if item_id is None:
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (name) VALUES (?)
+            ON CONFLICT(name) DO UPDATE SET name = name
+            RETURNING id
+            """,
+            (name,)
+        )
+        item_id = cursor.fetchone()[0]
+
+    cursor.execute(
+        f"""
+        INSERT OR IGNORE INTO {junction} (video_id, {column})
+        VALUES (?, ?)
+        """,
+        (video_id, item_id)
+    )
+
+    return item_id
+
+
+def _link_many_by_name(
+    cursor: sqlite3.Cursor,
+    table: str,
+    junction: str,
+    column: str,
+    video_id: int,
+    names: list[str],
+) -> dict[str, int]:
+    """
+    Links several items to a video by their names.
+        Items that don't exist yet are added to their table.
+        The items are added with multi-row inserts, and all links
+        with one statement, so the cost barely grows with the list.
+        Run this inside a transaction, so all writes commit together.
+
+    Args:
+        cursor (sqlite3.Cursor): The cursor to run the statements on.
+        table (str): The item table, such as 'tags'.
+            This must not be user input.
+        junction (str): The junction table, such as 'videos_tags'.
+            This must not be user input.
+        column (str): The item's column in the junction table.
+            This must not be user input.
+        video_id (int): The ID of the video to link to.
+        names (list[str]): The names of the items.
+
+    Returns:
+        dict[str, int]: A mapping of each name to its item ID.
+    """
+
+    # The no-op update on conflict makes RETURNING give the IDs,
+    #   whether just added or already existing
+    ids = dict(
+        _insert_rows(
+            cursor,
+            f"INSERT INTO {table} (name)",
+            [(name,) for name in dict.fromkeys(names)],
+            "ON CONFLICT(name) DO UPDATE SET name = name RETURNING name, id"
+        )
+    )
+
+    cursor.execute(
+        f"""
+        INSERT OR IGNORE INTO {junction} (video_id, {column})
+        SELECT ?, value FROM json_each(?)
+        """,
+        (video_id, json.dumps(list(ids.values())))
+    )
+
+    return ids
+
+
+def _fetch_dicts(
+    cursor: sqlite3.Cursor,
+) -> list[dict]:
+    """
+    Fetches the remaining rows of a query as dictionaries.
+        The column names are read once from the cursor,
+        rather than looked up for every row.
+
+    Args:
+        cursor (sqlite3.Cursor): A cursor that has run a query.
+
+    Returns:
+        list[dict]: One dictionary per row, keyed by column name.
+    """
+
+    # Iterating the cursor steps through the rows as the list is built,
+    #   rather than first copying them all into a list of tuples
+    keys = [column[0] for column in cursor.description]
+    return [dict(zip(keys, row)) for row in cursor]
+
+
+class _Connection(sqlite3.Connection):
+    """
+    A connection that tracks the contexts and cursors using it.
+        Nested contexts on one thread get the same pooled connection,
+        so only the outermost may commit, roll back or change it.
+    """
+
+    def __init__(
+        self,
+        *args,
+        **kwargs,
+    ) -> None:
+        """
+        Open the connection, with nothing using it yet.
+        """
+
+        super().__init__(*args, **kwargs)
+
+        # How many DatabaseContexts are using this connection
+        self.users = 0
+
+        # How many transactions are open on this connection
+        #   Manager commits are deferred while one is
+        self.depth = 0
+
+        # Cursors made on this connection that may still be open
+        #   Closed when the outermost context exits
+        self.cursors: weakref.WeakSet = weakref.WeakSet()
+
+    def cursor(
+        self,
+        *args,
+        **kwargs,
+    ) -> sqlite3.Cursor:
+        """
+        Make a cursor, and track it until it's closed.
+        """
+
+        cursor = super().cursor(*args, **kwargs)
+        self.cursors.add(cursor)
+        return cursor
+
+    def execute(
+        self,
+        sql: str,
+        parameters=(),
+    ) -> sqlite3.Cursor:
+        """
+        Run a statement on a new tracked cursor.
+            The built-in version makes its cursor without cursor().
+        """
+
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(
+        self,
+        sql: str,
+        parameters,
+    ) -> sqlite3.Cursor:
+        """
+        Run a statement for each set of parameters, on a tracked cursor.
+        """
+
+        return self.cursor().executemany(sql, parameters)
+
+    def close_cursors(
+        self
+    ) -> None:
+        """
+        Close every cursor still open on this connection.
+            An unfinished SELECT, such as a part-read generator, holds
+            its read snapshot open. A pooled connection would then
+            carry that old snapshot into the next context.
+        """
+
+        for cursor in list(self.cursors):
+            cursor.close()
+        self.cursors.clear()
+
+
+class _ConnectionPool(threading.local):
+    """
+    Keeps one open connection per thread and database path.
+        Opening a connection reads the schema and starts with a
+        cold page cache, so reusing them makes each request cheaper.
+        Connections are never shared between threads.
+    """
+
+    def __init__(
+        self
+    ) -> None:
+        """
+        Set up an empty pool. This runs once for each thread.
+        """
+
+        self.pid = os.getpid()
+        self.connections: dict[str, _Connection] = {}
+
+    def get(
+        self,
+        db_path: str,
+    ) -> _Connection | None:
+        """
+        Get this thread's connection to a database, if there is one.
+
+        Args:
+            db_path (str): The path to the SQLite database file.
+
+        Returns:
+            _Connection | None:
+                The open connection, or None if there isn't one yet.
+        """
+
+        # A forked process must not use its parent's connections
+        if self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.connections = {}
+
+        return self.connections.get(db_path)
+
+    def add(
+        self,
+        db_path: str,
+        conn: _Connection,
+    ) -> None:
+        """
+        Keep a connection for this thread to reuse.
+
+        Args:
+            db_path (str): The path to the SQLite database file.
+            conn (_Connection): The open connection.
+
+        Returns:
+            None
+        """
+
+        self.connections[db_path] = conn
+
+
+_pool = _ConnectionPool()
+
+
+@functools.lru_cache(maxsize=64)
+def _multi_row_sql(
+    insert: str,
+    width: int,
+    count: int,
+    suffix: str = "",
+) -> str:
+    """
+    Builds an INSERT statement that adds several rows at once.
+        The result is cached, as bulk inserts reuse the same few sizes.
+
+    Args:
+        insert (str): The start of the statement, up to 'VALUES'.
+        width (int): The number of columns in each row.
+        count (int): The number of rows.
+        suffix (str): Anything after the values, such as 'RETURNING'.
+
+    Returns:
+        str: The full statement, with placeholders for every value.
+    """
+
+    row = f"({', '.join(['?'] * width)})"
+    return f"{insert} VALUES {', '.join([row] * count)} {suffix}"
+
+
+def _insert_rows(
+    cursor: sqlite3.Cursor,
+    insert: str,
+    rows: list[tuple],
+    suffix: str = "",
+) -> list[tuple]:
+    """
+    Inserts rows using multi-row VALUES statements.
+        Each statement adds as many rows as the bound parameter
+        limit allows, so SQLite runs far fewer statements than
+        it would with one row each.
+
+    Args:
+        cursor (sqlite3.Cursor): The cursor to run the inserts on.
+        insert (str): The start of the statement, up to 'VALUES'.
+        rows (list[tuple]): The rows to insert, all the same width.
+        suffix (str): Anything after the values, such as 'RETURNING'.
+
+    Returns:
+        list[tuple]:
+            Any rows the statements returned, such as new IDs.
+            SQLite doesn't guarantee their order.
+    """
+
+    if not rows:
+        return []
+
+    results = []
+    width = len(rows[0])
+    per_statement = MAX_QUERY_PARAMS // width
+    for start in range(0, len(rows), per_statement):
+        chunk = rows[start:start + per_statement]
+        cursor.execute(
+            _multi_row_sql(insert, width, len(chunk), suffix),
+            list(itertools.chain.from_iterable(chunk))
+        )
+        results.extend(cursor.fetchall())
+
+    return results
 
 
 class DatabaseContext:
     """
     A context manager for handling SQLite database connections.
     This class can be used alonside other database operations classes.
+    Each thread keeps its connection open between contexts, to reuse it.
+    A context opened inside another on the same thread shares its
+    connection and transaction; only the outermost commits or rolls back.
+    When the outermost exits, its cursors are closed, so generators
+    such as 'get_iter' must be read before the context ends.
 
     Args:
         db_path (str): The path to the SQLite database file.
+        journal_mode (str): The SQLite journal mode.
+        synchronous (str): How often SQLite syncs to disk.
+        cache_size (int): The page cache size.
+            Negative values are in KiB, positive values are in pages.
+        mmap_size (int): The maximum bytes of the file to memory map.
+        autocommit (bool): Whether each manager method commits its
+            own changes. If False, everything is committed once,
+            when the context exits. This is much faster for bulk work:
+                with DatabaseContext(autocommit=False) as db:
+                    video_mgr = VideoManager(db)
+                    for row in rows:
+                        video_mgr.add(**row)
+        row_factory (Callable | None): The row factory for the
+            connection. Rows are plain tuples by default, as the
+            managers build their own dictionaries. A nested context
+            only sets it on its own cursor.
+        read_only (bool): Open the database read-only.
+            This is for code that only reads, such as page views.
+            SQLite refuses any write, and it never takes a write lock.
 
     Methods:
         __init__: Initializes the DatabaseContext with a database path.
         __enter__: Start the context manager and return the instance.
         __exit__: Exit the context manager, handling any exceptions.
+        _connect: Open and tune a new connection.
+        _ensure_indexes: Create lookup indexes the schema lacks.
+        _ensure_triggers: Create triggers that remove links on delete.
+        commit: Commit changes, unless autocommit is off.
+        committed: Check that there are no uncommitted changes.
+        rollback: Roll back changes, unless autocommit is off.
+        transaction: Group statements into one atomic change.
+        bulk_ingest: Import in one transaction, rebuilding indexes after.
     """
 
+    # Database paths whose indexes and triggers have been checked
+    #   by this process
+    _indexed_paths: set[str] = set()
+
+    # Junction table columns that aren't first in their primary key
+    #   The primary key covers lookups by video, but not the reverse
+    #   Each index also holds the other column, so a reverse lookup
+    #   is answered from the index alone, without reading the table
+    JUNCTION_INDEXES = (
+        ("video_categories", "category_id", "video_id"),
+        ("videos_tags", "tag_id", "video_id"),
+        ("videos_locations", "location_id", "video_id"),
+        ("videos_speakers", "speaker_id", "video_id"),
+        ("videos_bible_characters", "character_id", "video_id"),
+        ("videos_scriptures", "scripture_id", "video_id"),
+        ("video_similarity", "video_2_id", "video_1_id"),
+    )
+
+    # Links to remove when a row is deleted
+    #   The schema's foreign keys don't cascade, so triggers do it
+    DELETE_CASCADES = {
+        "videos": (
+            ("video_categories", "video_id"),
+            ("videos_tags", "video_id"),
+            ("videos_locations", "video_id"),
+            ("videos_speakers", "video_id"),
+            ("videos_bible_characters", "video_id"),
+            ("videos_scriptures", "video_id"),
+            ("video_similarity", "video_1_id"),
+            ("video_similarity", "video_2_id"),
+        ),
+        "categories": (("video_categories", "category_id"),),
+        "tags": (("videos_tags", "tag_id"),),
+        "location": (("videos_locations", "location_id"),),
+        "speakers": (("videos_speakers", "speaker_id"),),
+        "bible_characters": (("videos_bible_characters", "character_id"),),
+        "scriptures": (("videos_scriptures", "scripture_id"),),
+    }
+
     def __init__(
         self,
-        db_path: str = "videos.db"
+        db_path: str = "videos.db",
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        cache_size: int = -65536,
+        mmap_size: int = 268435456,
+        autocommit: bool = True,
+        row_factory: Callable | None = None,
+        read_only: bool = False,
     ) -> None:
         """
         Initializes the DatabaseContext with a database path.
-        """
+            The defaults suit a web app; WAL means readers don't block
+            the writer, and NORMAL is safe in WAL mode while needing
+            fewer fsyncs per commit than the default (FULL).
+
+        Each thread reuses one connection per database, so the
+            connection settings only apply when it is first opened.
+        """
+
+        # Reuse this thread's connection, if it has one
+        #   Read-only connections are kept separately
+        pool_key = f"{db_path}?mode=ro" if read_only else db_path
+        self.conn = _pool.get(pool_key)
+        if self.conn is None:
+            self.conn = self._connect(
+                db_path,
+                journal_mode,
+                synchronous,
+                cache_size,
+                mmap_size,
+                read_only,
+            )
+            _pool.add(pool_key, self.conn)
+
+        # A context opened inside another one on this thread shares
+        #   its connection, so it must leave the connection alone
+        self._outermost = not self.conn.users
+        self.conn.users += 1
+        if self._outermost:
+            self.conn.row_factory = row_factory
 
-        self.conn = sqlite3.connect(db_path)
-        self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
+        self.cursor.row_factory = row_factory
+        self.autocommit = autocommit
+        self.read_only = read_only
+
+        # Holds the transaction open, when autocommit is off
+        self._stack = contextlib.ExitStack()
+
+        # Only needs checking once per process
+        #   A read-only connection can't add indexes or triggers
+        #   These commit, so not while an outer context is open
+        #   If either fails, such as when another writer holds the
+        #   lock, the next context tries again
+        if (
+            not read_only and
+            self._outermost and
+            db_path not in DatabaseContext._indexed_paths
+        ):
+            indexed = self._ensure_indexes()
+            triggered = self._ensure_triggers()
+            if indexed and triggered:
+                DatabaseContext._indexed_paths.add(db_path)
+
+    @staticmethod
+    def _connect(
+        db_path: str,
+        journal_mode: str,
+        synchronous: str,
+        cache_size: int,
+        mmap_size: int,
+        read_only: bool = False,
+    ) -> _Connection:
+        """
+        Open and tune a new connection to the database.
+
+        Args:
+            db_path (str): The path to the SQLite database file.
+            journal_mode (str): The SQLite journal mode.
+            synchronous (str): How often SQLite syncs to disk.
+            cache_size (int): The page cache size.
+            mmap_size (int): The maximum bytes of the file to memory map.
+            read_only (bool): Open the database read-only.
+
+        Returns:
+            _Connection: The new connection.
+        """
+
+        # Read-only connections don't change the journal mode,
+        #   as that is a write, and sync settings don't apply
+        if read_only:
+            conn = sqlite3.connect(
+                f"{Path(db_path).resolve().as_uri()}?mode=ro",
+                uri=True,
+                cached_statements=256,
+                factory=_Connection,
+            )
+            conn.execute("PRAGMA query_only = 1")
+            conn.execute(f"PRAGMA cache_size = {int(cache_size)}")
+            conn.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            return conn
+
+        # Writes open their transaction with 'BEGIN IMMEDIATE'
+        #   This takes the write lock up front, rather than upgrading
+        #   from a read lock part way through the transaction
+        # sqlite3 caches prepared statements, keyed by their SQL
+        #   A larger cache means fewer statements are re-parsed
+        conn = sqlite3.connect(
+            db_path,
+            isolation_level="IMMEDIATE",
+            cached_statements=256,
+            factory=_Connection,
+        )
+
+        # Tune the connection
+        #   PRAGMA values can't be bound as parameters, so they are
+        #   formatted in; they come from code, not user input
+        conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {synchronous}")
+        conn.execute(f"PRAGMA cache_size = {int(cache_size)}")
+        conn.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+
+        # Reject links to rows that don't exist
+        #   Deletes still work, as triggers remove the links first
+        conn.execute("PRAGMA foreign_keys = ON")
+
+        return conn
 
     def __enter__(
         self
@@ -82,6 +682,10 @@ class DatabaseContext:
             DatabaseContext: The instance of the DatabaseContext.
         """
 
+        # With autocommit off, the whole context is one transaction
+        if not self.autocommit:
+            self._stack.enter_context(self.transaction())
+
         return self
 
     def __exit__(
@@ -98,18 +702,280 @@ class DatabaseContext:
             exc_val (Exception): The exception instance.
             exc_tb (traceback.TracebackException): The traceback object.
 
-        Returns:
+        Returns:
+            None
+        """
+
+        # Close the transaction, if autocommit is off
+        try:
+            self._stack.__exit__(exc_type, exc_val, exc_tb)
+
+        finally:
+            self.conn.users -= 1
+
+        # Only the outermost context commits or rolls back
+        #   An inner one's changes belong to the outer context
+        if not self._outermost:
+            return
+
+        # Commit or rollback
+        if exc_type:
+            self.conn.rollback()
+        else:
+            self.conn.commit()
+
+        # Let SQLite refresh query planner stats if it needs to
+        #   This is usually a no-op, so it's cheap to run every time
+        #   It may write the stats, so read-only connections skip it
+        if not self.read_only:
+            try:
+                self.conn.execute("PRAGMA optimize")
+
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"DatabaseContext: PRAGMA optimize failed: {e}"
+                )
+
+        # The connection stays open, for this thread to reuse
+        #   Its cursors don't, so the next context sees fresh data
+        self.conn.close_cursors()
+
+    def _ensure_indexes(
+        self
+    ) -> bool:
+        """
+        Create any missing indexes on the junction tables.
+            Names are already indexed by their UNIQUE constraints.
+            Also gathers query planner statistics, if there are none.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if all the indexes exist, False on error.
+        """
+
+        try:
+            for table, column, other in self.JUNCTION_INDEXES:
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS "
+                    f"idx_{table}_{column}_{other} "
+                    f"ON {table} ({column}, {other})"
+                )
+
+                # The older single column index is now redundant
+                self.conn.execute(
+                    f"DROP INDEX IF EXISTS idx_{table}_{column}"
+                )
+
+            # 'sqlite_stat1' is created the first time ANALYZE runs
+            stats = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            if not stats:
+                self.conn.execute("ANALYZE")
+
+            self.conn.commit()
+
+        # A read-only database still works, just without the indexes
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.warning(f"DatabaseContext: Could not add indexes: {e}")
+            return False
+
+        return True
+
+    def _ensure_triggers(
+        self
+    ) -> bool:
+        """
+        Create any missing triggers that remove links on delete.
+            Deleting a video, tag, speaker, etc, also deletes its rows
+            in the junction tables, in the same statement.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if all the triggers exist, False on error.
+        """
+
+        try:
+            for table, links in self.DELETE_CASCADES.items():
+                deletes = "".join(
+                    f"DELETE FROM {link} WHERE {column} = OLD.id; "
+                    for link, column in links
+                )
+                self.conn.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS trg_{table}_delete "
+                    f"AFTER DELETE ON {table} BEGIN {deletes}END"
+                )
+
+            self.conn.commit()
+
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.warning(f"DatabaseContext: Could not add triggers: {e}")
+            return False
+
+        return True
+
+    def commit(
+        self
+    ) -> None:
+        """
+        Commit changes made by a manager method.
+            If autocommit is off, or a transaction() block is open,
+            this does nothing; the changes are committed when the
+            context or block exits.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        if not self.conn.depth:
+            self.conn.commit()
+
+    def committed(
+        self
+    ) -> bool:
+        """
+        Check that there are no uncommitted changes on the connection.
+            Managers only cache IDs when this is True. Inside an open
+            transaction, even a released savepoint can still be rolled
+            back, and a cached ID would then point to a missing row.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if no transaction is open.
+        """
+
+        return not self.conn.in_transaction
+
+    def rollback(
+        self
+    ) -> None:
+        """
+        Roll back changes made by a manager method.
+            If autocommit is off, or a transaction() block is open,
+            this does nothing, so earlier work in the same context
+            or block isn't lost. The method's own changes are still
+            undone: a failed statement changes nothing, and methods
+            that make several changes put them in a transaction()
+            block, which rolls back to its savepoint.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        if not self.conn.depth:
+            self.conn.rollback()
+
+    @contextlib.contextmanager
+    def transaction(
+        self
+    ) -> Iterator[None]:
+        """
+        Run a block of statements as one transaction.
+            Commits once on success, or rolls back on error.
+            Manager methods called inside the block don't commit,
+            so a batch of them costs one commit, not one each.
+            If autocommit is off, or a block is already open,
+            the block joins that transaction instead, as a savepoint.
+            An error then undoes only this block's changes, and the
+            rest are committed with the outer transaction.
+
+        Args:
+            None
+
+        Yields:
+            None
+        """
+
+        if not self.conn.depth:
+            self.conn.depth += 1
+            try:
+                with self.conn:
+                    yield
+
+            finally:
+                self.conn.depth -= 1
+
+            return
+
+        # Start the outer transaction, if nothing has yet
+        #   Otherwise the savepoint would start it, and releasing
+        #   the savepoint would commit it
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN IMMEDIATE")
+
+        # Savepoints nest, so the depth gives each a unique name
+        savepoint = f"sp_{self.conn.depth}"
+        self.conn.execute(f"SAVEPOINT {savepoint}")
+        self.conn.depth += 1
+        try:
+            yield
+
+        except BaseException:
+            # Some errors end the whole transaction, savepoints included
+            if self.conn.in_transaction:
+                self.conn.execute(f"ROLLBACK TO {savepoint}")
+                self.conn.execute(f"RELEASE {savepoint}")
+            raise
+
+        else:
+            self.conn.execute(f"RELEASE {savepoint}")
+
+        finally:
+            self.conn.depth -= 1
+
+    @contextlib.contextmanager
+    def bulk_ingest(
+        self
+    ) -> Iterator[None]:
+        """
+        Run a large import as one transaction, without junction indexes.
+            The junction indexes are dropped at the start, and rebuilt
+            once at the end, instead of being updated for every row.
+            This only pays off when adding many thousands of links.
+            The indexes are dropped inside the transaction, so an error
+            rolls back to the original indexes.
+
+        Args:
+            None
+
+        Yields:
             None
         """
 
-        # Commit or rollback
-        if exc_type:
-            self.conn.rollback()
-        else:
-            self.conn.commit()
+        with self.transaction():
+            # The driver only opens a transaction before DML,
+            #   so open it here to include the DROP statements
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN IMMEDIATE")
+
+            for table, column, other in self.JUNCTION_INDEXES:
+                self.conn.execute(
+                    f"DROP INDEX IF EXISTS idx_{table}_{column}_{other}"
+                )
+
+            yield
 
-        # Close the connection
-        self.conn.close()
+            # Build each index in one pass over the finished table
+            for table, column, other in self.JUNCTION_INDEXES:
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS "
+                    f"idx_{table}_{column}_{other} "
+                    f"ON {table} ({column}, {other})"
+                )
 
 
 class VideoManager:
@@ -127,14 +993,100 @@ class VideoManager:
     Methods:
         __init__: Initializes the VideoManager with a DatabaseContext.
         add: Adds a new video to the database.
+        add_many: Adds several videos in one transaction.
         update: Updates an existing video in the database.
+        update_many: Updates several videos in one transaction.
         delete: Deletes a video from the database.
         get: Retrieves videos from the database.
+        get_iter: Lazily yields videos from the database.
+        get_full: Retrieves a video with all its related items.
         get_filter: Retrieves a filtered list of videos from the database.
+        get_by_categories: Retrieves the videos in several categories.
         name_to_id: Resolve a video name to its ID.
+        names_to_ids: Resolve several video names to their IDs.
         search: Search for videos by name or description.
     """
 
+    # Columns that 'add_many' and 'update_many' accept, in 'add' order
+    COLUMNS = (
+        "name", "description", "url", "url_1080", "url_720", "url_480",
+        "url_360", "url_240", "thumbnail", "duration", "date_added",
+    )
+
+    # The start of the 'add_many' insert, up to 'VALUES'
+    INSERT_SQL = f"INSERT INTO videos ({', '.join(COLUMNS)})"
+
+    # Sets every column, in 'COLUMNS' order, then matches the ID
+    #   Empty values ('' or 0) and None leave the column as it is
+    #   As the SQL never changes, SQLite only needs to prepare it once
+    UPDATE_SQL = """
+        UPDATE videos SET
+            name = COALESCE(NULLIF(?, ''), name),
+            description = COALESCE(NULLIF(?, ''), description),
+            url = COALESCE(NULLIF(?, ''), url),
+            url_1080 = COALESCE(NULLIF(?, ''), url_1080),
+            url_720 = COALESCE(NULLIF(?, ''), url_720),
+            url_480 = COALESCE(NULLIF(?, ''), url_480),
+            url_360 = COALESCE(NULLIF(?, ''), url_360),
+            url_240 = COALESCE(NULLIF(?, ''), url_240),
+            thumbnail = COALESCE(NULLIF(?, ''), thumbnail),
+            duration = COALESCE(NULLIF(?, 0), duration),
+            date_added = COALESCE(NULLIF(?, ''), date_added)
+        WHERE id = ?
+    """
+
+    # Related items that 'get_full' adds to a video, with the query that
+    #   collects each list as a JSON array, in the same columns as the
+    #   managers' 'get_from_video'
+    RELATED_SQL = {
+        "categories": """
+            SELECT json_group_array(json_object('id', x.id, 'name', x.name))
+            FROM video_categories j JOIN categories x ON x.id = j.category_id
+            WHERE j.video_id = v.id
+        """,
+        "tags": """
+            SELECT json_group_array(json_object('id', x.id, 'name', x.name))
+            FROM videos_tags j JOIN tags x ON x.id = j.tag_id
+            WHERE j.video_id = v.id
+        """,
+        "locations": """
+            SELECT json_group_array(json_object('id', x.id, 'name', x.name))
+            FROM videos_locations j JOIN location x ON x.id = j.location_id
+            WHERE j.video_id = v.id
+        """,
+        "speakers": """
+            SELECT json_group_array(json_object(
+                'id', x.id, 'name', x.name, 'profile_pic', x.profile_pic
+            ))
+            FROM videos_speakers j JOIN speakers x ON x.id = j.speaker_id
+            WHERE j.video_id = v.id
+        """,
+        "characters": """
+            SELECT json_group_array(json_object(
+                'id', x.id, 'name', x.name, 'profile_pic', x.profile_pic,
+                'date_range', x.date_range, 'description', x.description
+            ))
+            FROM videos_bible_characters j
+            JOIN bible_characters x ON x.id = j.character_id
+            WHERE j.video_id = v.id
+        """,
+        "scriptures": """
+            SELECT json_group_array(json_object(
+                'id', x.id, 'book', x.book, 'chapter', x.chapter,
+                'verse', x.verse, 'verse_text', x.verse_text
+            ))
+            FROM videos_scriptures j JOIN scriptures x ON x.id = j.scripture_id
+            WHERE j.video_id = v.id
+        """,
+    }
+
+    # One row per video, with each related list as an extra column
+    GET_FULL_SQL = (
+        "SELECT v.*, "
+        + ", ".join(f"({sql})" for sql in RELATED_SQL.values())
+        + " FROM videos v WHERE v.id = ?"
+    )
+
     def __init__(
         self,
         db: DatabaseContext
@@ -153,6 +1105,37 @@ class VideoManager:
 
         self.db = db
 
+    def _select_columns(
+        self,
+        columns: tuple[str, ...] | None,
+        alias: str = "",
+    ) -> str:
+        """
+        Builds the column list for a SELECT on the videos table.
+            Column names can't be bound as parameters,
+            so they're checked against the known columns instead.
+
+        Args:
+            columns (tuple[str, ...] | None): The columns to retrieve.
+                If None, retrieves all columns.
+            alias (str): The table alias to prefix each column with.
+                Defaults to no alias.
+
+        Returns:
+            str: The columns, ready to follow 'SELECT'.
+
+        Raises:
+            ValueError: If an unknown column is requested.
+        """
+
+        prefix = f"{alias}." if alias else ""
+        if columns is None:
+            return f"{prefix}*"
+        if columns and set(columns) <= {"id", *self.COLUMNS}:
+            return ", ".join(f"{prefix}{column}" for column in columns)
+
+        raise ValueError(f"Invalid video columns: {columns}")
+
     def add(
         self,
         name: str,
@@ -191,8 +1174,8 @@ class VideoManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print("VideoManager.add: Invalid video name provided.")
+        if not _nonblank(name):
+            logger.warning("VideoManager.add: Invalid video name provided.")
             return None
 
         # Add the entry
@@ -203,6 +1186,7 @@ class VideoManager:
                     name, description, url, url_1080, url_720, url_480,
                     url_360, url_240, thumbnail, duration, date_added
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                RETURNING id
                 """,
                 (
                     name,
@@ -218,19 +1202,123 @@ class VideoManager:
                     date_added
                 )
             )
-            video_id = self.db.cursor.lastrowid
-            self.db.conn.commit()
+            video_id = self.db.cursor.fetchone()[0]
+            self.db.commit()
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"VideoManager.add: "
                 f"An error occurred while adding the video:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return video_id
 
+    def add_many(
+        self,
+        rows: list[dict],
+    ) -> list[int] | None:
+        """
+        Adds several videos to the database in one transaction.
+            This is much faster than calling 'add' for each video,
+            as there is only one commit.
+            If any video can't be added, none of them are. Inside an
+            open transaction, only this call's changes are undone.
+
+        Args:
+            rows (list[dict]): The videos to add.
+                Each has the same keys as the arguments to 'add'.
+                Only 'name' is required.
+                A row may also have 'categories', a list of category
+                names to link the video to. The categories must exist.
+
+        Returns:
+            list[int] | None:
+                The IDs of the new videos, in the same order as 'rows'.
+                Or None if an error occurs.
+        """
+
+        # Check that each 'name' is a valid non-empty string
+        for row in rows:
+            name = row.get("name")
+            if not _nonblank(name):
+                logger.warning(
+                    "VideoManager.add_many: Invalid video name provided."
+                )
+                return None
+
+        if not rows:
+            return []
+
+        # Fill in defaults for any missing values, as 'add' does
+        params = [
+            tuple(
+                row.get(column, 0 if column == "duration" else "")
+                for column in self.COLUMNS
+            )
+            for row in rows
+        ]
+
+        cursor = self.db.conn.cursor()
+
+        # Every category name used by any row
+        category_names = list(dict.fromkeys(
+            name for row in rows for name in row.get("categories", ())
+        ))
+
+        # Add the entries
+        #   The transaction commits once on success,
+        #   or rolls back on error
+        try:
+            # Resolve all category names in one query, before adding
+            #   anything, so an unknown category adds nothing
+            category_ids = (
+                _ids_by_name(cursor, "categories", category_names)
+                if category_names
+                else {}
+            )
+            missing = [
+                name for name in category_names if name not in category_ids
+            ]
+            if missing:
+                logger.warning(
+                    f"VideoManager.add_many: Categories not found: {missing}"
+                )
+                return None
+
+            with self.db.transaction():
+                # Video names are unique, so they identify the new rows
+                #   RETURNING doesn't guarantee the order of the rows
+                returned = _insert_rows(
+                    cursor,
+                    self.INSERT_SQL,
+                    params,
+                    "RETURNING name, id"
+                )
+                ids = dict(returned)
+
+                # Link all the videos to their categories
+                _insert_rows(
+                    cursor,
+                    "INSERT OR IGNORE INTO video_categories "
+                    "(video_id, category_id)",
+                    [
+                        (ids[row["name"]], category_ids[name])
+                        for row in rows
+                        for name in row.get("categories", ())
+                    ]
+                )
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"VideoManager.add_many: "
+                f"An error occurred while adding the videos:\n{e}"
+            )
+            return None
+
+        return [ids[row["name"]] for row in rows]
+
     def update(
         self,
         id: int,
@@ -272,75 +1360,101 @@ class VideoManager:
                 Or None if an error occurs.
         """
 
-        # Build the update statement dynamically
-        #   based on provided (non-empty) values
-        fields = []
-        values = []
-
-        if name:
-            fields.append("name = ?")
-            values.append(name)
-        if description:
-            fields.append("description = ?")
-            values.append(description)
-        if url:
-            fields.append("url = ?")
-            values.append(url)
-        if url_1080:
-            fields.append("url_1080 = ?")
-            values.append(url_1080)
-        if url_720:
-            fields.append("url_720 = ?")
-            values.append(url_720)
-        if url_480:
-            fields.append("url_480 = ?")
-            values.append(url_480)
-        if url_360:
-            fields.append("url_360 = ?")
-            values.append(url_360)
-        if url_240:
-            fields.append("url_240 = ?")
-            values.append(url_240)
-        if thumbnail:
-            fields.append("thumbnail = ?")
-            values.append(thumbnail)
-        if duration:
-            fields.append("duration = ?")
-            values.append(duration)
-        if date_added:
-            fields.append("date_added = ?")
-            values.append(date_added)
-
-        if not fields:
-            logging.info("VideoManager.update: No fields to update.")
-            return None
-
-        # Set up the query
-        values.append(id)
-        query = f"UPDATE videos SET {', '.join(fields)} WHERE id = ?"
-
-        try:
-            self.db.cursor.execute(query, tuple(values))
+        values = (
+            name,
+            description,
+            url,
+            url_1080,
+            url_720,
+            url_480,
+            url_360,
+            url_240,
+            thumbnail,
+            duration,
+            date_added,
+        )
+
+        if not any(values):
+            logger.info("VideoManager.update: No fields to update.")
+            return None
+
+        try:
+            self.db.cursor.execute(self.UPDATE_SQL, values + (id,))
 
             # Check if any rows were affected
             if self.db.cursor.rowcount == 0:
-                print(f"VideoManager.update: No video found with ID {id}.")
-                self.db.conn.rollback()
+                logger.warning(
+                    f"VideoManager.update: No video found with ID {id}."
+                )
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"VideoManager.update: "
                 f"An error occurred while updating the video:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
 
+    def update_many(
+        self,
+        rows: list[dict],
+    ) -> int | None:
+        """
+        Updates several videos in the database in one transaction.
+            As with 'update', empty values are not updated.
+            If any video can't be updated, none of them are. Inside an
+            open transaction, only this call's changes are undone.
+
+        Args:
+            rows (list[dict]): The videos to update.
+                Each has an 'id', and any of the other keys
+                that 'update' accepts.
+
+        Returns:
+            int | None:
+                The number of videos updated.
+                Or None if an error occurs.
+        """
+
+        # Skip rows with nothing to update, as 'update' does
+        params = []
+        for row in rows:
+            if "id" not in row:
+                logger.warning(
+                    "VideoManager.update_many: A row has no video ID."
+                )
+                return None
+
+            values = tuple(row.get(column) for column in self.COLUMNS)
+            if any(values):
+                params.append(values + (row["id"],))
+
+        cursor = self.db.conn.cursor()
+
+        # Update the entries
+        #   The transaction commits once on success,
+        #   or rolls back on error
+        try:
+            with self.db.transaction():
+                cursor.executemany(self.UPDATE_SQL, params)
+                updated = cursor.rowcount if params else 0
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"VideoManager.update_many: "
+                f"An error occurred while updating the videos:\n{e}"
+            )
+            return None
+
+        return updated
+
     def delete(
         self,
         id: int,
@@ -366,19 +1480,21 @@ class VideoManager:
 
             # Check if any rows were affected
             if self.db.cursor.rowcount == 0:
-                print(f"VideoManager.delete: No video found with ID {id}.")
-                self.db.conn.rollback()
+                logger.warning(
+                    f"VideoManager.delete: No video found with ID {id}."
+                )
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
 
-        except Exception as e:
-            print(
-                f"VideoManager.update: "
-                f"An error occurred while updating the video:\n{e}"
+        except sqlite3.Error as e:
+            logger.error(
+                f"VideoManager.delete: "
+                f"An error occurred while deleting the video:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
@@ -386,6 +1502,7 @@ class VideoManager:
     def get(
         self,
         id: int | None = None,
+        columns: tuple[str, ...] | None = None,
     ) -> list[dict] | None:
         """
         Retrieves videos from the database.
@@ -395,6 +1512,8 @@ class VideoManager:
         Args:
             id (int | None): The ID of the video to retrieve.
                 If None, retrieves all videos. Defaults to None.
+            columns (tuple[str, ...] | None): The columns to retrieve.
+                If None, retrieves all columns. Defaults to None.
 
         Returns:
             list[dict] | None:
@@ -414,25 +1533,111 @@ class VideoManager:
                 date_added (str)
         """
 
-        # Fetch all videos
+        # Convert to a list of dictionaries, even for a single video
+        try:
+            items = list(self.get_iter(id, columns))
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"VideoManager.get: "
+                f"An error occurred while retrieving videos:\n{e}"
+            )
+            return None
+
+        return items
+
+    def get_iter(
+        self,
+        id: int | None = None,
+        columns: tuple[str, ...] | None = None,
+    ) -> Iterator[dict]:
+        """
+        Lazily yields videos from the database.
+            Rows are read from SQLite as they are consumed,
+            rather than building a full list up front.
+
+        Args:
+            id (int | None): The ID of the video to retrieve.
+                If None, yields all videos. Defaults to None.
+            columns (tuple[str, ...] | None): The columns to retrieve.
+                If None, retrieves all columns. Defaults to None.
+
+        Yields:
+            dict: The video details, one row at a time.
+
+        Raises:
+            ValueError: If an unknown column is requested.
+        """
+
+        # Column names can't be bound as parameters, so check them
+        select = self._select_columns(columns)
+
+        # Use a dedicated cursor, so other calls on the shared cursor
+        #   can't reset it part way through iteration
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
+        # Fetch all
         if id is None:
-            query = self.db.cursor.execute("SELECT * FROM videos")
+            cursor.execute(f"SELECT {select} FROM videos")
 
-        # Fetch a single video by ID
+        # Fetch a single item by ID
         else:
-            query = self.db.cursor.execute(
-                "SELECT * FROM videos WHERE id = ?",
+            cursor.execute(
+                f"SELECT {select} FROM videos WHERE id = ?",
                 (id,)
             )
 
-        # Convert to a list of dictionaries, even for a single video
+        # Read the column names once, rather than for every row
+        keys = [column[0] for column in cursor.description]
+        for row in cursor:
+            yield dict(zip(keys, row))
+
+    def get_full(
+        self,
+        id: int,
+    ) -> dict | None:
+        """
+        Retrieves a video along with everything linked to it.
+            One query returns the video and all its related items,
+            rather than one query for each kind of item.
+
+        Args:
+            id (int): The ID of the video to retrieve.
+
+        Returns:
+            dict | None:
+                The video details, as from 'get', plus lists of
+                categories, tags, locations, speakers, characters
+                and scriptures, as from each manager's 'get_from_video'.
+                Or None if the video doesn't exist, or an error occurs.
+        """
+
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
         try:
-            items = [dict(row) for row in query.fetchall()]
+            cursor.execute(self.GET_FULL_SQL, (id,))
+            row = cursor.fetchone()
 
-        except Exception:
+        except sqlite3.Error as e:
+            logger.error(
+                f"VideoManager.get_full: "
+                f"An error occurred while retrieving the video:\n{e}"
+            )
             return None
 
-        return items
+        if row is None:
+            return None
+
+        # The related lists are the last columns, as JSON arrays
+        count = len(self.RELATED_SQL)
+        keys = [column[0] for column in cursor.description[:-count]]
+        video = dict(zip(keys, row[:-count]))
+        for key, value in zip(self.RELATED_SQL, row[-count:]):
+            video[key] = json.loads(value)
+
+        return video
 
     def get_filter(
         self,
@@ -445,6 +1650,7 @@ class VideoManager:
         video_id: list[int] | None = None,
         missing_date: bool = False,
         latest: int = 0,
+        columns: tuple[str, ...] | None = None,
     ) -> list[dict] | None:
         """
         Retrieves a filtered list of videos from the database.
@@ -481,17 +1687,24 @@ class VideoManager:
             latest (int):
                 If set, retrieves the latest 'n' videos.
                 If 0, does not limit to latest. Defaults to 0.
+            columns (tuple[str, ...] | None): The columns to retrieve.
+                Callers that only count or match videos can ask for 'id'.
+                If None, retrieves all columns. Defaults to None.
 
         Returns:
             list[dict] | None:
                 A list of dictionaries containing video details if successful.
                 Or a None if an error occurs.
+
+        Raises:
+            ValueError: If an unknown column is requested.
         """
 
         # Setup the base query
         #   DISTINCT ensures no duplicate videos are returned
         #   The 'v' is an alias for the videos table
-        query = "SELECT DISTINCT v.* FROM videos v"
+        select = self._select_columns(columns, "v")
+        query = f"SELECT DISTINCT {select} FROM videos v"
 
         # Stores parts of the query, depending on the filters
         #   A JOIN combines rows from two or more tables
@@ -608,15 +1821,72 @@ class VideoManager:
 
         # Execute the query with the parameters
         try:
-            cursor = self.db.cursor.execute(query, tuple(params))
+            cursor = self.db.cursor.execute(query, params)
             # Convert to a list of dictionaries and return
-            return [dict(row) for row in cursor.fetchall()]
-        except Exception as e:
-            print(f"Error in get_filter: {e}")
-            print(f"Query: {query}")
-            print(f"Params: {params}")
+            return _fetch_dicts(cursor)
+        except sqlite3.Error as e:
+            logger.error(f"Error in get_filter: {e}")
+            logger.error(f"Query: {query}")
+            logger.error(f"Params: {params}")
             return None
 
+    def get_by_categories(
+        self,
+        category_ids: list[int],
+        columns: tuple[str, ...] | None = None,
+    ) -> dict[int, list[dict]] | None:
+        """
+        Retrieves the videos in each of several categories at once.
+            One query covers every category, rather than calling
+            'get_filter' once per category.
+
+        Args:
+            category_ids (list[int]): The IDs of the categories.
+            columns (tuple[str, ...] | None): The columns to retrieve.
+                If None, retrieves all columns. Defaults to None.
+
+        Returns:
+            dict[int, list[dict]] | None:
+                A mapping of category ID to its videos.
+                Categories with no videos map to an empty list.
+                Or None if an error occurs.
+
+        Raises:
+            ValueError: If an unknown column is requested.
+        """
+
+        select = self._select_columns(columns, "v")
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
+        # The IDs are passed as one JSON parameter,
+        #   so the SQL text is the same for any number of categories
+        try:
+            cursor.execute(
+                f"""
+                SELECT vc.category_id, {select}
+                FROM video_categories vc
+                JOIN videos v ON v.id = vc.video_id
+                WHERE vc.category_id IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(list(category_ids)),)
+            )
+
+            # Group the rows by category, leaving out the category ID
+            grouped = {category_id: [] for category_id in category_ids}
+            keys = [column[0] for column in cursor.description[1:]]
+            for category_id, *row in cursor:
+                grouped[category_id].append(dict(zip(keys, row)))
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"VideoManager.get_by_categories: "
+                f"An error occurred while retrieving videos:\n{e}"
+            )
+            return None
+
+        return grouped
+
     def name_to_id(
         self,
         name: str
@@ -634,8 +1904,10 @@ class VideoManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print("VideoManager.name_to_id: Invalid video name provided.")
+        if not _nonblank(name):
+            logger.warning(
+                "VideoManager.name_to_id: Invalid video name provided."
+            )
             return None
 
         try:
@@ -648,15 +1920,45 @@ class VideoManager:
             # There should be only one result, or nothing
             return result[0] if result else None
 
-        except Exception as e:
-            print(f"VideoManager.name_to_id: An error occurred while "
-                  f"resolving video name '{name}' to ID:\n{e}")
+        except sqlite3.Error as e:
+            logger.error(
+                f"VideoManager.name_to_id: An error occurred while "
+                f"resolving video name '{name}' to ID:\n{e}"
+            )
+            return None
+
+    def names_to_ids(
+        self,
+        names: list[str],
+    ) -> dict[str, int] | None:
+        """
+        Resolve several video names to their IDs at once.
+            This is much faster than calling 'name_to_id' for each name.
+
+        Args:
+            names (list[str]): The names of the videos.
+
+        Returns:
+            dict[str, int] | None:
+                A mapping of name to ID. Names that don't exist are left out.
+                Or None if an error occurs.
+        """
+
+        try:
+            return _ids_by_name(self.db.conn.cursor(), "videos", names)
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"VideoManager.names_to_ids: An error occurred while "
+                f"resolving video names to IDs:\n{e}"
+            )
             return None
 
     def search(
         self,
         query: str,
-        limit: int = 50
+        limit: int = 50,
+        columns: tuple[str, ...] | None = None,
     ) -> list[dict] | None:
         """
         Search for videos by name or description using LIKE pattern matching.
@@ -664,20 +1966,27 @@ class VideoManager:
         Args:
             query (str): The search query string.
             limit (int): Maximum number of results to return. Defaults to 50.
+            columns (tuple[str, ...] | None): The columns to retrieve.
+                If None, retrieves all columns. Defaults to None.
 
         Returns:
             list[dict] | None: A list of dictionaries containing video details
                 that match the search query, or None if an error occurs.
+
+        Raises:
+            ValueError: If an unknown column is requested.
         """
 
-        logging.info(f"Searching for videos with query: {query}")
+        select = self._select_columns(columns)
+
+        logger.info(f"Searching for videos with query: {query}")
         try:
             # Use LIKE with wildcards for partial matching
             # Search in both name and description fields
             search_pattern = f"%{query}%"
             cursor = self.db.cursor.execute(
-                """
-                SELECT * FROM videos
+                f"""
+                SELECT {select} FROM videos
                 WHERE name LIKE ? OR description LIKE ?
                 ORDER BY
                     CASE
@@ -698,10 +2007,10 @@ class VideoManager:
             )
 
             # Convert to a list of dictionaries and return
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
 
-        except Exception as e:
-            logging.error(f"Error searching videos: {e}")
+        except sqlite3.Error as e:
+            logger.error(f"Error searching videos: {e}")
             return None
 
 
@@ -721,13 +2030,18 @@ class CategoryManager:
     Methods:
         __init__: Initializes the CategoryManager with a DatabaseContext.
         add: Adds a new category to the database.
+        add_many: Adds several categories in one transaction.
         update: Updates an existing category in the database.
         delete: Deletes a category from the database.
         get: Retrieves categories from the database.
+        get_iter: Lazily yields categories from the database.
         get_from_video: Retrieves categories associated with a specific video.
+        get_from_videos: Retrieves categories for several videos at once.
         add_to_video: Adds a category to a specific video.
         remove_from_video: Removes a category from a specific video.
+        set_for_video: Sets the full list of categories for a video.
         name_to_id: Resolve a category name to its ID.
+        names_to_ids: Resolve several category names to their IDs.
     """
 
     def __init__(
@@ -748,6 +2062,10 @@ class CategoryManager:
 
         self.db = db
 
+        # Category name -> ID, loaded in full on the first lookup
+        #   None means not loaded yet, or dropped after a change
+        self._id_cache: dict[str, int] | None = None
+
     def add(
         self,
         name: str,
@@ -765,38 +2083,110 @@ class CategoryManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print("CategoryManager.add: Invalid category name provided.")
+        if not _nonblank(name):
+            logger.warning(
+                "CategoryManager.add: Invalid category name provided."
+            )
             return None
 
         # Add the entry
         try:
-            # Will just ignore it if it already exists
-            self.db.cursor.execute(
-                "INSERT OR IGNORE INTO categories (name) VALUES (?)",
-                (name,)
-            )
-            self.db.conn.commit()
-
-            # Get the ID of the category,
+            # The no-op update on conflict makes RETURNING give the ID,
             #   whether it was just added or already existed
             self.db.cursor.execute(
-                "SELECT id FROM categories WHERE name = ?",
+                """
+                INSERT INTO categories (name) VALUES (?)
+                ON CONFLICT(name) DO UPDATE SET name = name
+                RETURNING id
+                """,
                 (name,)
             )
-            row = self.db.cursor.fetchone()
-            category_id = row[0] if row else None
+            category_id = self.db.cursor.fetchone()[0]
+            self.db.commit()
+
+            # Keep a loaded cache complete
+            #   If an outer transaction may still roll the row back,
+            #   drop the cache, to be reloaded after it commits
+            if self._id_cache is not None:
+                if self.db.committed():
+                    self._id_cache[name] = category_id
+                else:
+                    self._id_cache = None
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"CategoryManager.add: "
                 f"An error occurred while adding the category:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return category_id
 
+    def add_many(
+        self,
+        names: list[str],
+    ) -> list[int] | None:
+        """
+        Adds several categories to the database in one transaction.
+            Any that already exist are left as they are.
+            If any can't be added, none of them are, even inside an
+            open transaction.
+
+        Args:
+            names (list[str]): The names of the categories to be added.
+
+        Returns:
+            list[int] | None:
+                The IDs of the categories, in the same order as 'names'.
+                Or None if an error occurs.
+        """
+
+        # Check that each 'name' is a valid non-empty string
+        for name in names:
+            if not _nonblank(name):
+                logger.warning(
+                    "CategoryManager.add_many: "
+                    "Invalid category name provided."
+                )
+                return None
+
+        cursor = self.db.conn.cursor()
+
+        # Add the entries
+        #   The transaction commits once on success,
+        #   or rolls back on error
+        try:
+            with self.db.transaction():
+                # The no-op update on conflict makes RETURNING give
+                #   the IDs, whether just added or already existing
+                returned = _insert_rows(
+                    cursor,
+                    "INSERT INTO categories (name)",
+                    [(name,) for name in names],
+                    "ON CONFLICT(name) DO UPDATE SET name = name "
+                    "RETURNING name, id"
+                )
+                ids = dict(returned)
+
+            # Keep a loaded cache complete
+            #   If an outer transaction may still roll the rows back,
+            #   drop the cache, to be reloaded after it commits
+            if self._id_cache is not None:
+                if self.db.committed():
+                    self._id_cache.update(ids)
+                else:
+                    self._id_cache = None
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"CategoryManager.add_many: "
+                f"An error occurred while adding the categories:\n{e}"
+            )
+            return None
+
+        return [ids[name] for name in names]
+
     def update(
         self,
         id: int,
@@ -817,8 +2207,8 @@ class CategoryManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print("VideoManager.add: Invalid video name provided.")
+        if not _nonblank(name):
+            logger.warning("VideoManager.add: Invalid video name provided.")
             return None
 
         # Update the entry
@@ -830,21 +2220,24 @@ class CategoryManager:
 
             # Check if any rows were affected
             if self.db.cursor.rowcount == 0:
-                print(
+                logger.warning(
                     f"CategoryManager.update: No category found with ID {id}."
                 )
-                self.db.conn.rollback()
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
+
+            # Cached names may be stale now
+            self._id_cache = None
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"CategoryManager.update: "
                 f"An error occurred while updating the category:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
@@ -874,21 +2267,24 @@ class CategoryManager:
 
             # Check if any rows were affected
             if self.db.cursor.rowcount == 0:
-                print(
+                logger.warning(
                     f"CategoryManager.delete: No category found with ID {id}."
                 )
-                self.db.conn.rollback()
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
 
-        except Exception as e:
-            print(
-                f"CategoryManager.update: "
-                f"An error occurred while updating the category:\n{e}"
+            # Cached names may be stale now
+            self._id_cache = None
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"CategoryManager.delete: "
+                f"An error occurred while deleting the category:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
@@ -912,25 +2308,56 @@ class CategoryManager:
                 Or a None if an error occurs.
         """
 
+        # Convert to a list of dictionaries, even for a single category
+        try:
+            items = list(self.get_iter(id))
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"CategoryManager.get: "
+                f"An error occurred while retrieving categories:\n{e}"
+            )
+            return None
+
+        return items
+
+    def get_iter(
+        self,
+        id: int | None = None,
+    ) -> Iterator[dict]:
+        """
+        Lazily yields categories from the database.
+            Rows are read from SQLite as they are consumed,
+            rather than building a full list up front.
+
+        Args:
+            id (int | None): The ID of the category to retrieve.
+                If None, yields all categories. Defaults to None.
+
+        Yields:
+            dict: The category details, one row at a time.
+        """
+
+        # Use a dedicated cursor, so other calls on the shared cursor
+        #   can't reset it part way through iteration
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
         # Fetch all
         if id is None:
-            query = self.db.cursor.execute("SELECT * FROM categories")
+            cursor.execute("SELECT id, name FROM categories")
 
-        # Fetch a single video by ID
+        # Fetch a single item by ID
         else:
-            query = self.db.cursor.execute(
-                "SELECT * FROM categories WHERE id = ?",
+            cursor.execute(
+                "SELECT id, name FROM categories WHERE id = ?",
                 (id,)
             )
 
-        # Convert to a list of dictionaries, even for a single video
-        try:
-            items = [dict(row) for row in query.fetchall()]
-
-        except Exception:
-            return None
-
-        return items
+        # Read the column names once, rather than for every row
+        keys = [column[0] for column in cursor.description]
+        for row in cursor:
+            yield dict(zip(keys, row))
 
     def get_from_video(
         self,
@@ -958,14 +2385,64 @@ class CategoryManager:
                 """,
                 (video_id,)
             )
-            items = [dict(row) for row in self.db.cursor.fetchall()]
+            items = _fetch_dicts(self.db.cursor)
 
-        except Exception as e:
-            print(f"Error retrieving categories for video {video_id}: {e}")
+        except sqlite3.Error as e:
+            logger.error(
+                f"Error retrieving categories for video {video_id}: {e}"
+            )
             return None
 
         return items
 
+    def get_from_videos(
+        self,
+        video_ids: list[int],
+    ) -> dict[int, list[dict]] | None:
+        """
+        Retrieves categories for several videos in a single query.
+            Avoids calling get_from_video once per video.
+
+        Args:
+            video_ids (list[int]): The IDs of the videos for which to
+                retrieve categories.
+
+        Returns:
+            dict[int, list[dict]] | None:
+                Video IDs mapped to a list of category details.
+                Videos without categories are not included.
+                Or None if an error occurs.
+        """
+
+        if not video_ids:
+            return {}
+
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
+        try:
+            cursor.execute(
+                """
+                SELECT vc.video_id, c.id, c.name
+                FROM categories c
+                JOIN video_categories vc ON c.id = vc.category_id
+                WHERE vc.video_id IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(list(video_ids)),)
+            )
+
+            # Group the categories by video
+            keys = [column[0] for column in cursor.description[1:]]
+            items = defaultdict(list)
+            for row in cursor:
+                items[row[0]].append(dict(zip(keys, row[1:])))
+
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving categories for videos: {e}")
+            return None
+
+        return dict(items)
+
     def add_to_video(
         self,
         video_id: int,
@@ -982,42 +2459,55 @@ class CategoryManager:
             category_id (int): The ID of the category to add to the video.
 
         Returns:
-            bool:
-                True if the category was successfully added to the video.
-                False if an error occurs or the association already exists.
-        """
-
-        # Verify video exists
-        self.db.cursor.execute(
-            "SELECT 1 FROM videos WHERE id = ?", (video_id,)
-        )
-        if not self.db.cursor.fetchone():
-            print(f"Video with ID {video_id} does not exist.")
-            return False
-
-        # Verify category exists
-        self.db.cursor.execute(
-            "SELECT 1 FROM categories WHERE id = ?", (category_id,)
-        )
-        if not self.db.cursor.fetchone():
-            print(f"Category with ID {category_id} does not exist.")
-            return False
+            bool:
+                True if the category was successfully added to the video.
+                False if an error occurs, or either ID doesn't exist.
+        """
 
+        # Link them in one statement
+        #   Selecting from both tables means nothing is inserted
+        #   if either ID doesn't exist
         try:
             self.db.cursor.execute(
                 """
                 INSERT OR IGNORE INTO video_categories (video_id, category_id)
-                VALUES (?, ?)
+                SELECT v.id, x.id FROM videos v, categories x
+                WHERE v.id = ? AND x.id = ?
                 """, (video_id, category_id)
             )
-            self.db.conn.commit()
+            added = self.db.cursor.rowcount
+            self.db.commit()
+
+            # Nothing was added, so either the link already exists,
+            #   or one of the IDs is invalid
+            if not added:
+                self.db.cursor.execute(
+                    """
+                    SELECT
+                        EXISTS (SELECT 1 FROM videos WHERE id = ?),
+                        EXISTS (SELECT 1 FROM categories WHERE id = ?)
+                    """, (video_id, category_id)
+                )
+                video_exists, category_exists = self.db.cursor.fetchone()
+
+        except sqlite3.Error as e:
+            self.db.rollback()
+            logger.error(f"Error linking category to video: {e}")
+            return False
+
+        if added:
             return True
 
-        except Exception as e:
-            self.db.conn.rollback()
-            print(f"Error linking category to video: {e}")
+        if not video_exists:
+            logger.warning(f"Video with ID {video_id} does not exist.")
+            return False
+
+        if not category_exists:
+            logger.warning(f"Category with ID {category_id} does not exist.")
             return False
 
+        return True
+
     def remove_from_video(
         self,
         video_id: int,
@@ -1047,12 +2537,72 @@ class CategoryManager:
                 """,
                 (video_id, category_id)
             )
-            self.db.conn.commit()
+            self.db.commit()
+            return True
+
+        except sqlite3.Error as e:
+            self.db.rollback()
+            logger.error(f"Error unlinking category from video: {e}")
+            return False
+
+    def set_for_video(
+        self,
+        video_id: int,
+        category_ids: list[int],
+    ) -> bool:
+        """
+        Sets the full list of categories for a video.
+            Links any new categories, and unlinks any that aren't listed.
+            The difference is worked out in SQL, in one transaction.
+
+        Args:
+            video_id (int): The ID of the video.
+            category_ids (list[int]): The IDs of the categories the video
+                should have. IDs that don't exist are ignored.
+
+        Returns:
+            bool:
+                True if the categories were successfully set.
+                False if an error occurs or the video doesn't exist.
+        """
+
+        cursor = self.db.conn.cursor()
+
+        # The IDs are passed as one JSON array,
+        #   so any number of them fits in a single parameter
+        ids = json.dumps(list(category_ids))
+
+        try:
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
+            )
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
+
+            with self.db.transaction():
+                cursor.execute(
+                    """
+                    DELETE FROM video_categories
+                    WHERE video_id = ?
+                    AND category_id NOT IN (SELECT value FROM json_each(?))
+                    """,
+                    (video_id, ids)
+                )
+                cursor.execute(
+                    """
+                    INSERT OR IGNORE INTO video_categories
+                        (video_id, category_id)
+                    SELECT ?, id FROM categories
+                    WHERE id IN (SELECT value FROM json_each(?))
+                    """,
+                    (video_id, ids)
+                )
             return True
 
-        except Exception as e:
-            self.db.conn.rollback()
-            print(f"Error unlinking category from video: {e}")
+        except sqlite3.Error as e:
+            logger.error(f"Error setting categories for video: {e}")
             return False
 
     def name_to_id(
@@ -1072,25 +2622,60 @@ class CategoryManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print(
+        if not _nonblank(name):
+            logger.warning(
                 "CategoryManager.name_to_id: Invalid category name provided."
             )
             return None
 
-        try:
-            self.db.cursor.execute(
-                "SELECT id FROM categories WHERE name = ?",
-                (name,)
-            )
-            result = self.db.cursor.fetchone()
+        # There are only a handful of categories,
+        #   so load them all at once and answer from memory after that
+        if self._id_cache is None:
+            try:
+                self.db.cursor.execute("SELECT name, id FROM categories")
+                ids = dict(self.db.cursor.fetchall())
 
-            # There should be only one result, or nothing
-            return result[0] if result else None
+            except sqlite3.Error as e:
+                logger.error(
+                    f"CategoryManager.name_to_id: An error occurred while "
+                    f"resolving category name '{name}' to ID:\n{e}"
+                )
+                return None
+
+            # An open transaction may have added some of them,
+            #   and may still roll them back, so don't keep them yet
+            if not self.db.committed():
+                return ids.get(name)
+
+            self._id_cache = ids
+
+        return self._id_cache.get(name)
+
+    def names_to_ids(
+        self,
+        names: list[str],
+    ) -> dict[str, int] | None:
+        """
+        Resolve several category names to their IDs at once.
+            This is much faster than calling 'name_to_id' for each name.
+
+        Args:
+            names (list[str]): The names of the categories.
+
+        Returns:
+            dict[str, int] | None:
+                A mapping of name to ID. Names that don't exist are left out.
+                Or None if an error occurs.
+        """
+
+        try:
+            return _ids_by_name(self.db.conn.cursor(), "categories", names)
 
-        except Exception as e:
-            print(f"CategoryManager.name_to_id: An error occurred while "
-                  f"resolving category name '{name}' to ID:\n{e}")
+        except sqlite3.Error as e:
+            logger.error(
+                f"CategoryManager.names_to_ids: An error occurred while "
+                f"resolving category names to IDs:\n{e}"
+            )
             return None
 
 
@@ -1110,13 +2695,22 @@ class TagManager:
     Methods:
         __init__(db: DatabaseContext) -> None
         add(name: str) -> int | None
+        add_many(names: list[str]) -> list[int] | None
         update(id: int, name: str) -> int | None
         delete(id: int) -> int | None
         get(id: int | None = None) -> list[dict] | None
+        get_iter(id: int | None = None) -> Iterator[dict]
         get_from_video(video_id: int) -> list[dict] | None
+        get_from_videos(video_ids: list[int]) -> dict[int, list[dict]] | None
         add_to_video(video_id: int, tag_id: int) -> bool
+        add_to_video_by_name(video_id: int, name: str) -> bool
+        add_many_to_video_by_name(video_id: int, names: list[str]) -> bool
+        add_many_to_video(video_id: int, tag_ids: list[int]) -> bool
         remove_from_video(video_id: int, tag_id: int) -> bool
+        remove_many_from_video(video_id: int, tag_ids: list[int]) -> bool
+        set_for_video(video_id: int, tag_ids: list[int]) -> bool
         name_to_id(name: str) -> int | None
+        names_to_ids(names: list[str]) -> dict[str, int] | None
     """
 
     def __init__(
@@ -1154,38 +2748,89 @@ class TagManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print("TagManager.add: Invalid tag name provided.")
+        if not _nonblank(name):
+            logger.warning("TagManager.add: Invalid tag name provided.")
             return None
 
         # Add the entry
         try:
-            # Will just ignore it if it already exists
-            self.db.cursor.execute(
-                "INSERT OR IGNORE INTO tags (name) VALUES (?)",
-                (name,)
-            )
-            self.db.conn.commit()
-
-            # Get the ID of the tag,
+            # The no-op update on conflict makes RETURNING give the ID,
             #   whether it was just added or already existed
             self.db.cursor.execute(
-                "SELECT id FROM tags WHERE name = ?",
+                """
+                INSERT INTO tags (name) VALUES (?)
+                ON CONFLICT(name) DO UPDATE SET name = name
+                RETURNING id
+                """,
                 (name,)
             )
-            row = self.db.cursor.fetchone()
-            tag_id = row[0] if row else None
+            tag_id = self.db.cursor.fetchone()[0]
+            self.db.commit()
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"TagManager.add: "
                 f"An error occurred while adding the tag:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return tag_id
 
+    def add_many(
+        self,
+        names: list[str],
+    ) -> list[int] | None:
+        """
+        Adds several tags to the database in one transaction.
+            Any that already exist are left as they are.
+            If any can't be added, none of them are, even inside an
+            open transaction.
+
+        Args:
+            names (list[str]): The names of the tags to be added.
+
+        Returns:
+            list[int] | None:
+                The IDs of the tags, in the same order as 'names'.
+                Or None if an error occurs.
+        """
+
+        # Check that each 'name' is a valid non-empty string
+        for name in names:
+            if not _nonblank(name):
+                logger.warning(
+                    "TagManager.add_many: Invalid tag name provided."
+                )
+                return None
+
+        cursor = self.db.conn.cursor()
+
+        # Add the entries
+        #   The transaction commits once on success,
+        #   or rolls back on error
+        try:
+            with self.db.transaction():
+                # The no-op update on conflict makes RETURNING give
+                #   the IDs, whether just added or already existing
+                returned = _insert_rows(
+                    cursor,
+                    "INSERT INTO tags (name)",
+                    [(name,) for name in names],
+                    "ON CONFLICT(name) DO UPDATE SET name = name "
+                    "RETURNING name, id"
+                )
+                ids = dict(returned)
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"TagManager.add_many: "
+                f"An error occurred while adding the tags:\n{e}"
+            )
+            return None
+
+        return [ids[name] for name in names]
+
     def update(
         self,
         id: int,
@@ -1206,8 +2851,8 @@ class TagManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print("TagManager.add: Invalid tag name provided.")
+        if not _nonblank(name):
+            logger.warning("TagManager.add: Invalid tag name provided.")
             return None
 
         # Update the entry
@@ -1219,19 +2864,21 @@ class TagManager:
 
             # Check if any rows were affected
             if self.db.cursor.rowcount == 0:
-                print(f"TagManager.update: No tag found with ID {id}.")
-                self.db.conn.rollback()
+                logger.warning(
+                    f"TagManager.update: No tag found with ID {id}."
+                )
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"TagManager.update: "
                 f"An error occurred while updating the tag:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
@@ -1261,19 +2908,21 @@ class TagManager:
 
             # Check if any rows were affected
             if self.db.cursor.rowcount == 0:
-                print(f"TagManager.delete: No tag found with ID {id}.")
-                self.db.conn.rollback()
+                logger.warning(
+                    f"TagManager.delete: No tag found with ID {id}."
+                )
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
 
-        except Exception as e:
-            print(
-                f"TagManager.update: "
-                f"An error occurred while updating the tag:\n{e}"
+        except sqlite3.Error as e:
+            logger.error(
+                f"TagManager.delete: "
+                f"An error occurred while deleting the tag:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
@@ -1292,150 +2941,495 @@ class TagManager:
                 If None, retrieves all tags. Defaults to None.
 
         Returns:
-            list[dict] | None:
-                A list of dictionaries containing tag details if successful.
-                Or a None if an error occurs.
+            list[dict] | None:
+                A list of dictionaries containing tag details if successful.
+                Or a None if an error occurs.
+        """
+
+        # Convert to a list of dictionaries, even for a single tag
+        try:
+            items = list(self.get_iter(id))
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"TagManager.get: "
+                f"An error occurred while retrieving tags:\n{e}"
+            )
+            return None
+
+        return items
+
+    def get_iter(
+        self,
+        id: int | None = None,
+    ) -> Iterator[dict]:
+        """
+        Lazily yields tags from the database.
+            Rows are read from SQLite as they are consumed,
+            rather than building a full list up front.
+
+        Args:
+            id (int | None): The ID of the tag to retrieve.
+                If None, yields all tags. Defaults to None.
+
+        Yields:
+            dict: The tag details, one row at a time.
+        """
+
+        # Use a dedicated cursor, so other calls on the shared cursor
+        #   can't reset it part way through iteration
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
+        # Fetch all
+        if id is None:
+            cursor.execute("SELECT id, name FROM tags")
+
+        # Fetch a single item by ID
+        else:
+            cursor.execute(
+                "SELECT id, name FROM tags WHERE id = ?",
+                (id,)
+            )
+
+        # Read the column names once, rather than for every row
+        keys = [column[0] for column in cursor.description]
+        for row in cursor:
+            yield dict(zip(keys, row))
+
+    def get_from_video(
+        self,
+        video_id: int,
+    ) -> list[dict] | None:
+        """
+        Retrieves tags associated with a specific video.
+
+        Args:
+            video_id (int): The ID of the video for which to retrieve tags.
+
+        Returns:
+            list[dict] | None:
+                A list of dictionaries containing tag details if successful.
+                Or None if an error occurs.
+        """
+
+        try:
+            self.db.cursor.execute(
+                """
+                SELECT t.* FROM tags t
+                JOIN videos_tags vt ON t.id = vt.tag_id
+                WHERE vt.video_id = ?
+                """,
+                (video_id,)
+            )
+            items = _fetch_dicts(self.db.cursor)
+
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving tags for video {video_id}: {e}")
+            return None
+
+        return items
+
+    def get_from_videos(
+        self,
+        video_ids: list[int],
+    ) -> dict[int, list[dict]] | None:
+        """
+        Retrieves tags for several videos in a single query.
+            Avoids calling get_from_video once per video.
+
+        Args:
+            video_ids (list[int]): The IDs of the videos for which to
+                retrieve tags.
+
+        Returns:
+            dict[int, list[dict]] | None:
+                Video IDs mapped to a list of tag details.
+                Videos without tags are not included.
+                Or None if an error occurs.
+        """
+
+        if not video_ids:
+            return {}
+
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
+        try:
+            cursor.execute(
+                """
+                SELECT vt.video_id, t.id, t.name
+                FROM tags t
+                JOIN videos_tags vt ON t.id = vt.tag_id
+                WHERE vt.video_id IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(list(video_ids)),)
+            )
+
+            # Group the tags by video
+            keys = [column[0] for column in cursor.description[1:]]
+            items = defaultdict(list)
+            for row in cursor:
+                items[row[0]].append(dict(zip(keys, row[1:])))
+
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving tags for videos: {e}")
+            return None
+
+        return dict(items)
+
+    def add_to_video(
+        self,
+        video_id: int,
+        tag_id: int
+    ) -> bool:
+        """
+        Adds a category to a video in the database.
+            Uses the 'videos_tags' junction table to associate
+            a video with a tag.
+
+        Args:
+            video_id (int): The ID of the video to which the tag will be added.
+            tag_id (int): The ID of the tag to add to the video.
+
+        Returns:
+            bool:
+                True if the tag was successfully added to the video.
+                False if an error occurs, or either ID doesn't exist.
+        """
+
+        # Link them in one statement
+        #   Selecting from both tables means nothing is inserted
+        #   if either ID doesn't exist
+        try:
+            self.db.cursor.execute(
+                """
+                INSERT OR IGNORE INTO videos_tags (video_id, tag_id)
+                SELECT v.id, x.id FROM videos v, tags x
+                WHERE v.id = ? AND x.id = ?
+                """, (video_id, tag_id)
+            )
+            added = self.db.cursor.rowcount
+            self.db.commit()
+
+            # Nothing was added, so either the link already exists,
+            #   or one of the IDs is invalid
+            if not added:
+                self.db.cursor.execute(
+                    """
+                    SELECT
+                        EXISTS (SELECT 1 FROM videos WHERE id = ?),
+                        EXISTS (SELECT 1 FROM tags WHERE id = ?)
+                    """, (video_id, tag_id)
+                )
+                video_exists, tag_exists = self.db.cursor.fetchone()
+
+        except sqlite3.Error as e:
+            self.db.rollback()
+            logger.error(f"Error linking tag to video: {e}")
+            return False
+
+        if added:
+            return True
+
+        if not video_exists:
+            logger.warning(f"Video with ID {video_id} does not exist.")
+            return False
+
+        if not tag_exists:
+            logger.warning(f"Tag with ID {tag_id} does not exist.")
+            return False
+
+        return True
+
+    def add_to_video_by_name(
+        self,
+        video_id: int,
+        name: str,
+    ) -> bool:
+        """
+        Adds a tag to a video, using the tag's name.
+            The tag is created if it doesn't already exist.
+            Both happen in one transaction, with one commit.
+
+        Args:
+            video_id (int): The ID of the video to which the tag
+                will be added.
+            name (str): The name of the tag to add to the video.
+
+        Returns:
+            bool:
+                True if the tag was successfully added to the video.
+                False if an error occurs.
+        """
+
+        cursor = self.db.conn.cursor()
+
+        # Check that 'name' is a valid non-empty string
+        if not _nonblank(name):
+            logger.warning(
+                "TagManager.add_to_video_by_name: "
+                "Invalid tag name provided."
+            )
+            return False
+
+        try:
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
+            )
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
+
+            with self.db.transaction():
+                # Add the tag if needed, then link it to the video
+                _link_by_name(
+                    cursor, "tags", "videos_tags", "tag_id",
+                    video_id, name
+                )
+            return True
+
+        except sqlite3.Error as e:
+            logger.error(f"Error linking tag to video: {e}")
+            return False
+
+    def add_many_to_video_by_name(
+        self,
+        video_id: int,
+        names: list[str],
+    ) -> bool:
+        """
+        Adds several tags to a video, using their names.
+            Any tags that don't exist yet are created.
+            Everything happens in one transaction, with one commit.
+
+        Args:
+            video_id (int): The ID of the video to which the tags
+                will be added.
+            names (list[str]): The names of the tags to add.
+
+        Returns:
+            bool:
+                True if the tags were successfully added to the video.
+                False if an error occurs.
         """
 
-        # Fetch all
-        if id is None:
-            query = self.db.cursor.execute("SELECT * FROM tags")
+        # Check that each 'name' is a valid non-empty string
+        for name in names:
+            if not _nonblank(name):
+                logger.warning(
+                    "TagManager.add_many_to_video_by_name: "
+                    "Invalid tag name provided."
+                )
+                return False
 
-        # Fetch a single item by ID
-        else:
-            query = self.db.cursor.execute(
-                "SELECT * FROM tags WHERE id = ?",
-                (id,)
-            )
+        if not names:
+            return True
+
+        cursor = self.db.conn.cursor()
 
-        # Convert to a list of dictionaries, even for a single item
         try:
-            items = [dict(row) for row in query.fetchall()]
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
+            )
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
 
-        except Exception:
-            return None
+            with self.db.transaction():
+                # Add any new tags, then link them all to the video
+                _link_many_by_name(
+                    cursor, "tags", "videos_tags", "tag_id",
+                    video_id, names
+                )
+            return True
 
-        return items
+        except sqlite3.Error as e:
+            logger.error(f"Error linking tags to video: {e}")
+            return False
 
-    def get_from_video(
+    def remove_from_video(
         self,
         video_id: int,
-    ) -> list[dict] | None:
+        tag_id: int
+    ) -> bool:
         """
-        Retrieves tags associated with a specific video.
+        Removes a tag from a video in the database.
+            Uses the 'videos_tags' junction table to disassociate
 
         Args:
-            video_id (int): The ID of the video for which to retrieve tags.
+            video_id (int): The ID of the video from which the
+                tag will be removed.
+            tag_id (int): The ID of the tag to remove from the video.
 
         Returns:
-            list[dict] | None:
-                A list of dictionaries containing tag details if successful.
-                Or None if an error occurs.
+            bool:
+                True if the tag was successfully removed from the video.
+                False if an error occurs or the association does not exist.
         """
 
         try:
             self.db.cursor.execute(
                 """
-                SELECT t.* FROM tags t
-                JOIN videos_tags vt ON t.id = vt.tag_id
-                WHERE vt.video_id = ?
+                DELETE FROM videos_tags
+                WHERE video_id = ?
+                AND tag_id = ?
                 """,
-                (video_id,)
+                (video_id, tag_id)
             )
-            items = [dict(row) for row in self.db.cursor.fetchall()]
-
-        except Exception as e:
-            print(f"Error retrieving tags for video {video_id}: {e}")
-            return None
+            self.db.commit()
+            return True
 
-        return items
+        except sqlite3.Error as e:
+            self.db.rollback()
+            logger.error(f"Error unlinking tag from video: {e}")
+            return False
 
-    def add_to_video(
+    def set_for_video(
         self,
         video_id: int,
-        tag_id: int
+        tag_ids: list[int],
     ) -> bool:
         """
-        Adds a category to a video in the database.
-            Uses the 'videos_tags' junction table to associate
-            a video with a tag.
+        Sets the full list of tags for a video.
+            Links any new tags, and unlinks any that aren't listed.
+            The difference is worked out in SQL, in one transaction.
 
         Args:
-            video_id (int): The ID of the video to which the tag will be added.
-            tag_id (int): The ID of the tag to add to the video.
+            video_id (int): The ID of the video.
+            tag_ids (list[int]): The IDs of the tags the video
+                should have. IDs that don't exist are ignored.
 
         Returns:
             bool:
-                True if the tag was successfully added to the video.
-                False if an error occurs or the association already exists.
+                True if the tags were successfully set.
+                False if an error occurs or the video doesn't exist.
         """
 
-        # Verify video exists
-        self.db.cursor.execute(
-            "SELECT 1 FROM videos WHERE id = ?", (video_id,)
-        )
-        if not self.db.cursor.fetchone():
-            print(f"Video with ID {video_id} does not exist.")
-            return False
+        cursor = self.db.conn.cursor()
 
-        # Verify tag exists
-        self.db.cursor.execute(
-            "SELECT 1 FROM tags WHERE id = ?", (tag_id,)
-        )
-        if not self.db.cursor.fetchone():
-            print(f"Tag with ID {tag_id} does not exist.")
-            return False
+        # The IDs are passed as one JSON array,
+        #   so any number of them fits in a single parameter
+        ids = json.dumps(list(tag_ids))
 
         try:
-            self.db.cursor.execute(
-                """
-                INSERT OR IGNORE INTO videos_tags (video_id, tag_id)
-                VALUES (?, ?)
-                """, (video_id, tag_id)
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
             )
-            self.db.conn.commit()
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
+
+            with self.db.transaction():
+                cursor.execute(
+                    """
+                    DELETE FROM videos_tags
+                    WHERE video_id = ?
+                    AND tag_id NOT IN (SELECT value FROM json_each(?))
+                    """,
+                    (video_id, ids)
+                )
+                cursor.execute(
+                    """
+                    INSERT OR IGNORE INTO videos_tags (video_id, tag_id)
+                    SELECT ?, id FROM tags
+                    WHERE id IN (SELECT value FROM json_each(?))
+                    """,
+                    (video_id, ids)
+                )
             return True
 
-        except Exception as e:
-            self.db.conn.rollback()
-            print(f"Error linking tag to video: {e}")
+        except sqlite3.Error as e:
+            logger.error(f"Error setting tags for video: {e}")
             return False
 
-    def remove_from_video(
+    def add_many_to_video(
         self,
         video_id: int,
-        tag_id: int
+        tag_ids: list[int],
     ) -> bool:
         """
-        Removes a tag from a video in the database.
-            Uses the 'videos_tags' junction table to disassociate
+        Adds several tags to a video at once.
+            All links are inserted by one statement, with one commit.
+            Existing links are left as they are.
 
         Args:
-            video_id (int): The ID of the video from which the
-                tag will be removed.
-            tag_id (int): The ID of the tag to remove from the video.
+            video_id (int): The ID of the video to which the tags
+                will be added.
+            tag_ids (list[int]): The IDs of the tags to add.
+                IDs that don't exist are ignored.
 
         Returns:
             bool:
-                True if the tag was successfully removed from the video.
-                False if an error occurs or the association does not exist.
+                True if the tags were successfully added to the video.
+                False if an error occurs or the video doesn't exist.
         """
 
+        cursor = self.db.conn.cursor()
+
         try:
-            self.db.cursor.execute(
-                """
-                DELETE FROM videos_tags
-                WHERE video_id = ?
-                AND tag_id = ?
-                """,
-                (video_id, tag_id)
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
             )
-            self.db.conn.commit()
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
+
+            with self.db.transaction():
+                cursor.execute(
+                    """
+                    INSERT OR IGNORE INTO videos_tags (video_id, tag_id)
+                    SELECT ?, id FROM tags
+                    WHERE id IN (SELECT value FROM json_each(?))
+                    """,
+                    (video_id, json.dumps(list(tag_ids)))
+                )
+            return True
+
+        except sqlite3.Error as e:
+            logger.error(f"Error linking tags to video: {e}")
+            return False
+
+    def remove_many_from_video(
+        self,
+        video_id: int,
+        tag_ids: list[int],
+    ) -> bool:
+        """
+        Removes several tags from a video at once.
+            All links are deleted by one statement, with one commit.
+
+        Args:
+            video_id (int): The ID of the video from which the tags
+                will be removed.
+            tag_ids (list[int]): The IDs of the tags to remove.
+
+        Returns:
+            bool:
+                True if the statement succeeded.
+                False if an error occurs.
+        """
+
+        cursor = self.db.conn.cursor()
+
+        try:
+            with self.db.transaction():
+                cursor.execute(
+                    """
+                    DELETE FROM videos_tags
+                    WHERE video_id = ?
+                    AND tag_id IN (SELECT value FROM json_each(?))
+                    """,
+                    (video_id, json.dumps(list(tag_ids)))
+                )
             return True
 
-        except Exception as e:
-            self.db.conn.rollback()
-            print(f"Error unlinking tag from video: {e}")
+        except sqlite3.Error as e:
+            logger.error(f"Error unlinking tags from video: {e}")
             return False
 
     def name_to_id(
@@ -1455,8 +3449,8 @@ class TagManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print(
+        if not _nonblank(name):
+            logger.warning(
                 "TagManager.name_to_id: Invalid tag name provided."
             )
             return None
@@ -1471,9 +3465,38 @@ class TagManager:
             # There should be only one result, or nothing
             return result[0] if result else None
 
-        except Exception as e:
-            print(f"TagManager.name_to_id: An error occurred while "
-                  f"resolving tag name '{name}' to ID:\n{e}")
+        except sqlite3.Error as e:
+            logger.error(
+                f"TagManager.name_to_id: An error occurred while "
+                f"resolving tag name '{name}' to ID:\n{e}"
+            )
+            return None
+
+    def names_to_ids(
+        self,
+        names: list[str],
+    ) -> dict[str, int] | None:
+        """
+        Resolve several tag names to their IDs at once.
+            This is much faster than calling 'name_to_id' for each name.
+
+        Args:
+            names (list[str]): The names of the tags.
+
+        Returns:
+            dict[str, int] | None:
+                A mapping of name to ID. Names that don't exist are left out.
+                Or None if an error occurs.
+        """
+
+        try:
+            return _ids_by_name(self.db.conn.cursor(), "tags", names)
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"TagManager.names_to_ids: An error occurred while "
+                f"resolving tag names to IDs:\n{e}"
+            )
             return None
 
 
@@ -1483,7 +3506,7 @@ class LocationManager:
         - Add/Update/Delete locations
         - Add/Update/Remove locations to/from videos
         - Get locations (all, assigned to a video)
-        - Resolve location name to ID
+        - Resolve location names to IDs, one or many at a time
 
     Args:
         db (DatabaseContext):
@@ -1526,34 +3549,33 @@ class LocationManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print("LocationManager.add: Invalid location name provided.")
+        if not _nonblank(name):
+            logger.warning(
+                "LocationManager.add: Invalid location name provided."
+            )
             return None
 
         # Add the entry
         try:
-            # Will just ignore it if it already exists
-            self.db.cursor.execute(
-                "INSERT OR IGNORE INTO location (name) VALUES (?)",
-                (name,)
-            )
-            self.db.conn.commit()
-
-            # Get the ID of the location,
+            # The no-op update on conflict makes RETURNING give the ID,
             #   whether it was just added or already existed
             self.db.cursor.execute(
-                "SELECT id FROM location WHERE name = ?",
+                """
+                INSERT INTO location (name) VALUES (?)
+                ON CONFLICT(name) DO UPDATE SET name = name
+                RETURNING id
+                """,
                 (name,)
             )
-            row = self.db.cursor.fetchone()
-            location_id = row[0] if row else None
+            location_id = self.db.cursor.fetchone()[0]
+            self.db.commit()
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"LocationManager.add: "
                 f"An error occurred while adding the location:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return location_id
@@ -1578,8 +3600,10 @@ class LocationManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print("LocationManager.add: Invalid location name provided.")
+        if not _nonblank(name):
+            logger.warning(
+                "LocationManager.add: Invalid location name provided."
+            )
             return None
 
         # Update the entry
@@ -1591,21 +3615,21 @@ class LocationManager:
 
             # Check if any rows were affected
             if self.db.cursor.rowcount == 0:
-                print(
+                logger.warning(
                     f"LocationManager.update: No location found with ID {id}."
                 )
-                self.db.conn.rollback()
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"LocationManager.update: "
                 f"An error occurred while updating the location:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
@@ -1635,21 +3659,21 @@ class LocationManager:
 
             # Check if any rows were affected
             if self.db.cursor.rowcount == 0:
-                print(
+                logger.warning(
                     f"LocationManager.delete: No location found with ID {id}."
                 )
-                self.db.conn.rollback()
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
 
-        except Exception as e:
-            print(
-                f"LocationManager.update: "
-                f"An error occurred while updating the location:\n{e}"
+        except sqlite3.Error as e:
+            logger.error(
+                f"LocationManager.delete: "
+                f"An error occurred while deleting the location:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
@@ -1673,110 +3697,312 @@ class LocationManager:
                 Or a None if an error occurs.
         """
 
-        # Fetch all
-        if id is None:
-            query = self.db.cursor.execute("SELECT * FROM location")
+        # Convert to a list of dictionaries, even for a single location
+        try:
+            items = list(self.get_iter(id))
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"LocationManager.get: "
+                f"An error occurred while retrieving locations:\n{e}"
+            )
+            return None
+
+        return items
+
+    def get_iter(
+        self,
+        id: int | None = None,
+    ) -> Iterator[dict]:
+        """
+        Lazily yields locations from the database.
+            Rows are read from SQLite as they are consumed,
+            rather than building a full list up front.
+
+        Args:
+            id (int | None): The ID of the location to retrieve.
+                If None, yields all locations. Defaults to None.
+
+        Yields:
+            dict: The location details, one row at a time.
+        """
+
+        # Use a dedicated cursor, so other calls on the shared cursor
+        #   can't reset it part way through iteration
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
+        # Fetch all
+        if id is None:
+            cursor.execute("SELECT id, name FROM location")
+
+        # Fetch a single item by ID
+        else:
+            cursor.execute(
+                "SELECT id, name FROM location WHERE id = ?",
+                (id,)
+            )
+
+        # Read the column names once, rather than for every row
+        keys = [column[0] for column in cursor.description]
+        for row in cursor:
+            yield dict(zip(keys, row))
+
+    def get_from_video(
+        self,
+        video_id: int,
+    ) -> list[dict] | None:
+        """
+        Retrieves locations associated with a specific video.
+
+        Args:
+            video_id (int):
+                The ID of the video for which to retrieve locations.
+
+        Returns:
+            list[dict] | None:
+                A list of dictionaries containing locations if successful.
+                Or None if an error occurs.
+        """
+
+        try:
+            self.db.cursor.execute(
+                """
+                SELECT l.* FROM location l
+                JOIN videos_locations vl ON l.id = vl.location_id
+                WHERE vl.video_id = ?
+                """,
+                (video_id,)
+            )
+            items = _fetch_dicts(self.db.cursor)
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"Error retrieving locations for video {video_id}: {e}"
+            )
+            return None
+
+        return items
+
+    def get_from_videos(
+        self,
+        video_ids: list[int],
+    ) -> dict[int, list[dict]] | None:
+        """
+        Retrieves locations for several videos in a single query.
+            Avoids calling get_from_video once per video.
+
+        Args:
+            video_ids (list[int]): The IDs of the videos for which to
+                retrieve locations.
+
+        Returns:
+            dict[int, list[dict]] | None:
+                Video IDs mapped to a list of location details.
+                Videos without locations are not included.
+                Or None if an error occurs.
+        """
+
+        if not video_ids:
+            return {}
+
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
+        try:
+            cursor.execute(
+                """
+                SELECT vl.video_id, l.id, l.name
+                FROM location l
+                JOIN videos_locations vl ON l.id = vl.location_id
+                WHERE vl.video_id IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(list(video_ids)),)
+            )
+
+            # Group the locations by video
+            keys = [column[0] for column in cursor.description[1:]]
+            items = defaultdict(list)
+            for row in cursor:
+                items[row[0]].append(dict(zip(keys, row[1:])))
+
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving locations for videos: {e}")
+            return None
+
+        return dict(items)
+
+    def add_to_video(
+        self,
+        video_id: int,
+        location_id: int
+    ) -> bool:
+        """
+        Adds a category to a video in the database.
+            Uses the 'videos_locations' junction table to associate
+            a video with a location.
+
+        Args:
+            video_id (int):
+                The ID of the video to which the location will be added.
+            location_id (int): The ID of the location to add to the video.
+
+        Returns:
+            bool:
+                True if the location was successfully added to the video.
+                False if an error occurs, or either ID doesn't exist.
+        """
+
+        # Link them in one statement
+        #   Selecting from both tables means nothing is inserted
+        #   if either ID doesn't exist
+        try:
+            self.db.cursor.execute(
+                """
+                INSERT OR IGNORE INTO videos_locations (video_id, location_id)
+                SELECT v.id, x.id FROM videos v, location x
+                WHERE v.id = ? AND x.id = ?
+                """, (video_id, location_id)
+            )
+            added = self.db.cursor.rowcount
+            self.db.commit()
+
+            # Nothing was added, so either the link already exists,
+            #   or one of the IDs is invalid
+            if not added:
+                self.db.cursor.execute(
+                    """
+                    SELECT
+                        EXISTS (SELECT 1 FROM videos WHERE id = ?),
+                        EXISTS (SELECT 1 FROM location WHERE id = ?)
+                    """, (video_id, location_id)
+                )
+                video_exists, location_exists = self.db.cursor.fetchone()
+
+        except sqlite3.Error as e:
+            self.db.rollback()
+            logger.error(f"Error linking location to video: {e}")
+            return False
 
-        # Fetch a single item by ID
-        else:
-            query = self.db.cursor.execute(
-                "SELECT * FROM location WHERE id = ?",
-                (id,)
-            )
+        if added:
+            return True
 
-        # Convert to a list of dictionaries, even for a single item
-        try:
-            items = [dict(row) for row in query.fetchall()]
+        if not video_exists:
+            logger.warning(f"Video with ID {video_id} does not exist.")
+            return False
 
-        except Exception:
-            return None
+        if not location_exists:
+            logger.warning(f"Location with ID {location_id} does not exist.")
+            return False
 
-        return items
+        return True
 
-    def get_from_video(
+    def add_to_video_by_name(
         self,
         video_id: int,
-    ) -> list[dict] | None:
+        name: str,
+    ) -> bool:
         """
-        Retrieves locations associated with a specific video.
+        Adds a location to a video, using the location's name.
+            The location is created if it doesn't already exist.
+            Both happen in one transaction, with one commit.
 
         Args:
-            video_id (int):
-                The ID of the video for which to retrieve locations.
+            video_id (int): The ID of the video to which the location
+                will be added.
+            name (str): The name of the location to add to the video.
 
         Returns:
-            list[dict] | None:
-                A list of dictionaries containing locations if successful.
-                Or None if an error occurs.
+            bool:
+                True if the location was successfully added to the video.
+                False if an error occurs.
         """
 
+        cursor = self.db.conn.cursor()
+
+        # Check that 'name' is a valid non-empty string
+        if not _nonblank(name):
+            logger.warning(
+                "LocationManager.add_to_video_by_name: "
+                "Invalid location name provided."
+            )
+            return False
+
         try:
-            self.db.cursor.execute(
-                """
-                SELECT l.* FROM location l
-                JOIN videos_locations vl ON l.id = vl.location_id
-                WHERE vl.video_id = ?
-                """,
-                (video_id,)
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
             )
-            items = [dict(row) for row in self.db.cursor.fetchall()]
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
 
-        except Exception as e:
-            print(f"Error retrieving locations for video {video_id}: {e}")
-            return None
+            with self.db.transaction():
+                # Add the location if needed, then link it to the video
+                _link_by_name(
+                    cursor, "location", "videos_locations", "location_id",
+                    video_id, name
+                )
+            return True
 
-        return items
+        except sqlite3.Error as e:
+            logger.error(f"Error linking location to video: {e}")
+            return False
 
-    def add_to_video(
+    def add_many_to_video_by_name(
         self,
         video_id: int,
-        location_id: int
+        names: list[str],
     ) -> bool:
         """
-        Adds a category to a video in the database.
-            Uses the 'videos_locations' junction table to associate
-            a video with a location.
+        Adds several locations to a video, using their names.
+            Any locations that don't exist yet are created.
+            Everything happens in one transaction, with one commit.
 
         Args:
-            video_id (int):
-                The ID of the video to which the location will be added.
-            location_id (int): The ID of the location to add to the video.
+            video_id (int): The ID of the video to which the locations
+                will be added.
+            names (list[str]): The names of the locations to add.
 
         Returns:
             bool:
-                True if the location was successfully added to the video.
-                False if an error occurs or the association already exists.
+                True if the locations were successfully added to the video.
+                False if an error occurs.
         """
 
-        # Verify video exists
-        self.db.cursor.execute(
-            "SELECT 1 FROM videos WHERE id = ?", (video_id,)
-        )
-        if not self.db.cursor.fetchone():
-            print(f"Video with ID {video_id} does not exist.")
-            return False
+        # Check that each 'name' is a valid non-empty string
+        for name in names:
+            if not _nonblank(name):
+                logger.warning(
+                    "LocationManager.add_many_to_video_by_name: "
+                    "Invalid location name provided."
+                )
+                return False
 
-        # Verify location exists
-        self.db.cursor.execute(
-            "SELECT 1 FROM location WHERE id = ?", (location_id,)
-        )
-        if not self.db.cursor.fetchone():
-            print(f"Location with ID {location_id} does not exist.")
-            return False
+        if not names:
+            return True
+
+        cursor = self.db.conn.cursor()
 
         try:
-            self.db.cursor.execute(
-                """
-                INSERT OR IGNORE INTO videos_locations (video_id, location_id)
-                VALUES (?, ?)
-                """, (video_id, location_id)
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
             )
-            self.db.conn.commit()
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
+
+            with self.db.transaction():
+                # Add any new locations, then link them all to the video
+                _link_many_by_name(
+                    cursor, "location", "videos_locations", "location_id",
+                    video_id, names
+                )
             return True
 
-        except Exception as e:
-            self.db.conn.rollback()
-            print(f"Error linking location to video: {e}")
+        except sqlite3.Error as e:
+            logger.error(f"Error linking locations to video: {e}")
             return False
 
     def remove_from_video(
@@ -1808,12 +4034,12 @@ class LocationManager:
                 """,
                 (video_id, location_id)
             )
-            self.db.conn.commit()
+            self.db.commit()
             return True
 
-        except Exception as e:
-            self.db.conn.rollback()
-            print(f"Error unlinking location from video: {e}")
+        except sqlite3.Error as e:
+            self.db.rollback()
+            logger.error(f"Error unlinking location from video: {e}")
             return False
 
     def name_to_id(
@@ -1833,8 +4059,8 @@ class LocationManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print(
+        if not _nonblank(name):
+            logger.warning(
                 "locationManager.name_to_id: Invalid location name provided."
             )
             return None
@@ -1849,9 +4075,38 @@ class LocationManager:
             # There should be only one result, or nothing
             return result[0] if result else None
 
-        except Exception as e:
-            print(f"LocationManager.name_to_id: An error occurred while "
-                  f"resolving location name '{name}' to ID:\n{e}")
+        except sqlite3.Error as e:
+            logger.error(
+                f"LocationManager.name_to_id: An error occurred while "
+                f"resolving location name '{name}' to ID:\n{e}"
+            )
+            return None
+
+    def names_to_ids(
+        self,
+        names: list[str],
+    ) -> dict[str, int] | None:
+        """
+        Resolve several location names to their IDs at once.
+            This is much faster than calling 'name_to_id' for each name.
+
+        Args:
+            names (list[str]): The names of the locations.
+
+        Returns:
+            dict[str, int] | None:
+                A mapping of name to ID. Names that don't exist are left out.
+                Or None if an error occurs.
+        """
+
+        try:
+            return _ids_by_name(self.db.conn.cursor(), "location", names)
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"LocationManager.names_to_ids: An error occurred while "
+                f"resolving location names to IDs:\n{e}"
+            )
             return None
 
 
@@ -1859,9 +4114,9 @@ class SpeakerManager:
     """
     A class for managing speaker-related operations in the database.
         - Add/Update/Delete speaker
-        - Add/Update/Remove speaker to/from videos
+        - Add/Update/Remove speaker to/from videos, one or many at a time
         - Get speaker (all, assigned to a video)
-        - Resolve speaker name to ID
+        - Resolve speaker names to IDs, one or many at a time
 
     Args:
         db (DatabaseContext):
@@ -1904,34 +4159,33 @@ class SpeakerManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print("SpeakerManager.add: Invalid speaker name provided.")
+        if not _nonblank(name):
+            logger.warning(
+                "SpeakerManager.add: Invalid speaker name provided."
+            )
             return None
 
         # Add the entry
         try:
-            # Will just ignore it if it already exists
-            self.db.cursor.execute(
-                "INSERT OR IGNORE INTO speakers (name) VALUES (?)",
-                (name,)
-            )
-            self.db.conn.commit()
-
-            # Get the ID of the speaker,
+            # The no-op update on conflict makes RETURNING give the ID,
             #   whether it was just added or already existed
             self.db.cursor.execute(
-                "SELECT id FROM speakers WHERE name = ?",
+                """
+                INSERT INTO speakers (name) VALUES (?)
+                ON CONFLICT(name) DO UPDATE SET name = name
+                RETURNING id
+                """,
                 (name,)
             )
-            row = self.db.cursor.fetchone()
-            speaker_id = row[0] if row else None
+            speaker_id = self.db.cursor.fetchone()[0]
+            self.db.commit()
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"SpeakerManager.add: "
                 f"An error occurred while adding the speaker:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return speaker_id
@@ -1956,8 +4210,10 @@ class SpeakerManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print("SpeakerManager.update: Invalid speaker name provided.")
+        if not _nonblank(name):
+            logger.warning(
+                "SpeakerManager.update: Invalid speaker name provided."
+            )
             return None
 
         # Update the entry
@@ -1969,19 +4225,21 @@ class SpeakerManager:
 
             # Check if any rows were affected
             if self.db.cursor.rowcount == 0:
-                print(f"SpeakerManager.update: No speaker found with ID {id}.")
-                self.db.conn.rollback()
+                logger.warning(
+                    f"SpeakerManager.update: No speaker found with ID {id}."
+                )
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"SpeakerManager.update: "
                 f"An error occurred while updating the speaker:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
@@ -2011,19 +4269,21 @@ class SpeakerManager:
 
             # Check if any rows were affected
             if self.db.cursor.rowcount == 0:
-                print(f"SpeakerManager.delete: No speaker found with ID {id}.")
-                self.db.conn.rollback()
+                logger.warning(
+                    f"SpeakerManager.delete: No speaker found with ID {id}."
+                )
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
 
-        except Exception as e:
-            print(
-                f"SpeakerManager.update: "
-                f"An error occurred while updating the speaker:\n{e}"
+        except sqlite3.Error as e:
+            logger.error(
+                f"SpeakerManager.delete: "
+                f"An error occurred while deleting the speaker:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
@@ -2047,25 +4307,56 @@ class SpeakerManager:
                 Or a None if an error occurs.
         """
 
+        # Convert to a list of dictionaries, even for a single speaker
+        try:
+            items = list(self.get_iter(id))
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"SpeakerManager.get: "
+                f"An error occurred while retrieving speakers:\n{e}"
+            )
+            return None
+
+        return items
+
+    def get_iter(
+        self,
+        id: int | None = None,
+    ) -> Iterator[dict]:
+        """
+        Lazily yields speakers from the database.
+            Rows are read from SQLite as they are consumed,
+            rather than building a full list up front.
+
+        Args:
+            id (int | None): The ID of the speaker to retrieve.
+                If None, yields all speakers. Defaults to None.
+
+        Yields:
+            dict: The speaker details, one row at a time.
+        """
+
+        # Use a dedicated cursor, so other calls on the shared cursor
+        #   can't reset it part way through iteration
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
         # Fetch all
         if id is None:
-            query = self.db.cursor.execute("SELECT * FROM speakers")
+            cursor.execute("SELECT id, name, profile_pic FROM speakers")
 
         # Fetch a single item by ID
         else:
-            query = self.db.cursor.execute(
-                "SELECT * FROM speakers WHERE id = ?",
+            cursor.execute(
+                "SELECT id, name, profile_pic FROM speakers WHERE id = ?",
                 (id,)
             )
 
-        # Convert to a list of dictionaries, even for a single item
-        try:
-            items = [dict(row) for row in query.fetchall()]
-
-        except Exception:
-            return None
-
-        return items
+        # Read the column names once, rather than for every row
+        keys = [column[0] for column in cursor.description]
+        for row in cursor:
+            yield dict(zip(keys, row))
 
     def get_from_video(
         self,
@@ -2092,14 +4383,64 @@ class SpeakerManager:
                 """,
                 (video_id,)
             )
-            items = [dict(row) for row in self.db.cursor.fetchall()]
+            items = _fetch_dicts(self.db.cursor)
 
-        except Exception as e:
-            print(f"Error retrieving speakers for video {video_id}: {e}")
+        except sqlite3.Error as e:
+            logger.error(
+                f"Error retrieving speakers for video {video_id}: {e}"
+            )
             return None
 
         return items
 
+    def get_from_videos(
+        self,
+        video_ids: list[int],
+    ) -> dict[int, list[dict]] | None:
+        """
+        Retrieves speakers for several videos in a single query.
+            Avoids calling get_from_video once per video.
+
+        Args:
+            video_ids (list[int]): The IDs of the videos for which to
+                retrieve speakers.
+
+        Returns:
+            dict[int, list[dict]] | None:
+                Video IDs mapped to a list of speaker details.
+                Videos without speakers are not included.
+                Or None if an error occurs.
+        """
+
+        if not video_ids:
+            return {}
+
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
+        try:
+            cursor.execute(
+                """
+                SELECT vs.video_id, s.id, s.name, s.profile_pic
+                FROM speakers s
+                JOIN videos_speakers vs ON s.id = vs.speaker_id
+                WHERE vs.video_id IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(list(video_ids)),)
+            )
+
+            # Group the speakers by video
+            keys = [column[0] for column in cursor.description[1:]]
+            items = defaultdict(list)
+            for row in cursor:
+                items[row[0]].append(dict(zip(keys, row[1:])))
+
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving speakers for videos: {e}")
+            return None
+
+        return dict(items)
+
     def add_to_video(
         self,
         video_id: int,
@@ -2117,38 +4458,159 @@ class SpeakerManager:
         Returns:
             bool:
                 True if the speaker was successfully added to the video.
-                False if an error occurs or the association already exists.
+                False if an error occurs, or either ID doesn't exist.
         """
 
-        # Verify video exists
-        self.db.cursor.execute(
-            "SELECT 1 FROM videos WHERE id = ?", (video_id,)
-        )
-        if not self.db.cursor.fetchone():
-            print(f"Video with ID {video_id} does not exist.")
-            return False
-
-        # Verify speaker exists
-        self.db.cursor.execute(
-            "SELECT 1 FROM speakers WHERE id = ?", (speaker_id,)
-        )
-        if not self.db.cursor.fetchone():
-            print(f"Speaker with ID {speaker_id} does not exist.")
-            return False
-
+        # Link them in one statement
+        #   Selecting from both tables means nothing is inserted
+        #   if either ID doesn't exist
         try:
             self.db.cursor.execute(
                 """
                 INSERT OR IGNORE INTO videos_speakers (video_id, speaker_id)
-                VALUES (?, ?)
+                SELECT v.id, x.id FROM videos v, speakers x
+                WHERE v.id = ? AND x.id = ?
                 """, (video_id, speaker_id)
             )
-            self.db.conn.commit()
+            added = self.db.cursor.rowcount
+            self.db.commit()
+
+            # Nothing was added, so either the link already exists,
+            #   or one of the IDs is invalid
+            if not added:
+                self.db.cursor.execute(
+                    """
+                    SELECT
+                        EXISTS (SELECT 1 FROM videos WHERE id = ?),
+                        EXISTS (SELECT 1 FROM speakers WHERE id = ?)
+                    """, (video_id, speaker_id)
+                )
+                video_exists, speaker_exists = self.db.cursor.fetchone()
+
+        except sqlite3.Error as e:
+            self.db.rollback()
+            logger.error(f"Error linking speaker to video: {e}")
+            return False
+
+        if added:
+            return True
+
+        if not video_exists:
+            logger.warning(f"Video with ID {video_id} does not exist.")
+            return False
+
+        if not speaker_exists:
+            logger.warning(f"Speaker with ID {speaker_id} does not exist.")
+            return False
+
+        return True
+
+    def add_to_video_by_name(
+        self,
+        video_id: int,
+        name: str,
+    ) -> bool:
+        """
+        Adds a speaker to a video, using the speaker's name.
+            The speaker is created if it doesn't already exist.
+            Both happen in one transaction, with one commit.
+
+        Args:
+            video_id (int): The ID of the video to which the speaker
+                will be added.
+            name (str): The name of the speaker to add to the video.
+
+        Returns:
+            bool:
+                True if the speaker was successfully added to the video.
+                False if an error occurs.
+        """
+
+        cursor = self.db.conn.cursor()
+
+        # Check that 'name' is a valid non-empty string
+        if not _nonblank(name):
+            logger.warning(
+                "SpeakerManager.add_to_video_by_name: "
+                "Invalid speaker name provided."
+            )
+            return False
+
+        try:
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
+            )
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
+
+            with self.db.transaction():
+                # Add the speaker if needed, then link it to the video
+                _link_by_name(
+                    cursor, "speakers", "videos_speakers", "speaker_id",
+                    video_id, name
+                )
+            return True
+
+        except sqlite3.Error as e:
+            logger.error(f"Error linking speaker to video: {e}")
+            return False
+
+    def add_many_to_video_by_name(
+        self,
+        video_id: int,
+        names: list[str],
+    ) -> bool:
+        """
+        Adds several speakers to a video, using their names.
+            Any speakers that don't exist yet are created.
+            Everything happens in one transaction, with one commit.
+
+        Args:
+            video_id (int): The ID of the video to which the speakers
+                will be added.
+            names (list[str]): The names of the speakers to add.
+
+        Returns:
+            bool:
+                True if the speakers were successfully added to the video.
+                False if an error occurs.
+        """
+
+        # Check that each 'name' is a valid non-empty string
+        for name in names:
+            if not _nonblank(name):
+                logger.warning(
+                    "SpeakerManager.add_many_to_video_by_name: "
+                    "Invalid speaker name provided."
+                )
+                return False
+
+        if not names:
+            return True
+
+        cursor = self.db.conn.cursor()
+
+        try:
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
+            )
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
+
+            with self.db.transaction():
+                # Add any new speakers, then link them all to the video
+                _link_many_by_name(
+                    cursor, "speakers", "videos_speakers", "speaker_id",
+                    video_id, names
+                )
             return True
 
-        except Exception as e:
-            self.db.conn.rollback()
-            print(f"Error linking speaker to video: {e}")
+        except sqlite3.Error as e:
+            logger.error(f"Error linking speakers to video: {e}")
             return False
 
     def remove_from_video(
@@ -2180,12 +4642,99 @@ class SpeakerManager:
                 """,
                 (video_id, speaker_id)
             )
-            self.db.conn.commit()
+            self.db.commit()
+            return True
+
+        except sqlite3.Error as e:
+            self.db.rollback()
+            logger.error(f"Error unlinking speaker from video: {e}")
+            return False
+
+    def add_many_to_video(
+        self,
+        video_id: int,
+        speaker_ids: list[int],
+    ) -> bool:
+        """
+        Adds several speakers to a video at once.
+            All links are inserted by one statement, with one commit.
+            Existing links are left as they are.
+
+        Args:
+            video_id (int): The ID of the video to which the speakers
+                will be added.
+            speaker_ids (list[int]): The IDs of the speakers to add.
+                IDs that don't exist are ignored.
+
+        Returns:
+            bool:
+                True if the speakers were successfully added to the video.
+                False if an error occurs or the video doesn't exist.
+        """
+
+        cursor = self.db.conn.cursor()
+
+        try:
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
+            )
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
+
+            with self.db.transaction():
+                cursor.execute(
+                    """
+                    INSERT OR IGNORE INTO videos_speakers
+                        (video_id, speaker_id)
+                    SELECT ?, id FROM speakers
+                    WHERE id IN (SELECT value FROM json_each(?))
+                    """,
+                    (video_id, json.dumps(list(speaker_ids)))
+                )
+            return True
+
+        except sqlite3.Error as e:
+            logger.error(f"Error linking speakers to video: {e}")
+            return False
+
+    def remove_many_from_video(
+        self,
+        video_id: int,
+        speaker_ids: list[int],
+    ) -> bool:
+        """
+        Removes several speakers from a video at once.
+            All links are deleted by one statement, with one commit.
+
+        Args:
+            video_id (int): The ID of the video from which the speakers
+                will be removed.
+            speaker_ids (list[int]): The IDs of the speakers to remove.
+
+        Returns:
+            bool:
+                True if the statement succeeded.
+                False if an error occurs.
+        """
+
+        cursor = self.db.conn.cursor()
+
+        try:
+            with self.db.transaction():
+                cursor.execute(
+                    """
+                    DELETE FROM videos_speakers
+                    WHERE video_id = ?
+                    AND speaker_id IN (SELECT value FROM json_each(?))
+                    """,
+                    (video_id, json.dumps(list(speaker_ids)))
+                )
             return True
 
-        except Exception as e:
-            self.db.conn.rollback()
-            print(f"Error unlinking speaker from video: {e}")
+        except sqlite3.Error as e:
+            logger.error(f"Error unlinking speakers from video: {e}")
             return False
 
     def name_to_id(
@@ -2205,8 +4754,8 @@ class SpeakerManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print(
+        if not _nonblank(name):
+            logger.warning(
                 "SpeakerManager.name_to_id: Invalid speaker name provided."
             )
             return None
@@ -2221,9 +4770,38 @@ class SpeakerManager:
             # There should be only one result, or nothing
             return result[0] if result else None
 
-        except Exception as e:
-            print(f"SpeakerManager.name_to_id: An error occurred while "
-                  f"resolving speaker name '{name}' to ID:\n{e}")
+        except sqlite3.Error as e:
+            logger.error(
+                f"SpeakerManager.name_to_id: An error occurred while "
+                f"resolving speaker name '{name}' to ID:\n{e}"
+            )
+            return None
+
+    def names_to_ids(
+        self,
+        names: list[str],
+    ) -> dict[str, int] | None:
+        """
+        Resolve several speaker names to their IDs at once.
+            This is much faster than calling 'name_to_id' for each name.
+
+        Args:
+            names (list[str]): The names of the speakers.
+
+        Returns:
+            dict[str, int] | None:
+                A mapping of name to ID. Names that don't exist are left out.
+                Or None if an error occurs.
+        """
+
+        try:
+            return _ids_by_name(self.db.conn.cursor(), "speakers", names)
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"SpeakerManager.names_to_ids: An error occurred while "
+                f"resolving speaker names to IDs:\n{e}"
+            )
             return None
 
 
@@ -2231,9 +4809,15 @@ class CharacterManager:
     """
     A class for managing character-related operations in the database.
         - Add/Update/Delete character
-        - Add/Update/Remove character to/from videos
+        - Add/Update/Remove character to/from videos, one or many at a time
         - Get character (all, assigned to a video)
-        - Resolve character name to ID
+        - Resolve character names to IDs, one or many at a time
+
+    Each method uses its own cursor on the shared connection,
+        so one call can't clobber the results of another.
+
+    Character IDs are cached by name as they are added,
+        so repeated adds (common in bulk imports) skip SQLite.
 
     Args:
         db (DatabaseContext):
@@ -2259,6 +4843,9 @@ class CharacterManager:
 
         self.db = db
 
+        # Character name -> ID, filled as characters are added
+        self._id_cache: dict[str, int] = {}
+
     def add(
         self,
         name: str,
@@ -2276,36 +4863,45 @@ class CharacterManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print("CharacterManager.add: Invalid character name provided.")
+        if not _nonblank(name):
+            logger.warning(
+                "CharacterManager.add: Invalid character name provided."
+            )
             return None
 
+        # Already seen, so it exists
+        if name in self._id_cache:
+            return self._id_cache[name]
+
+        cursor = self.db.conn.cursor()
+
         # Add the entry
+        #   The transaction commits once on success,
+        #   or rolls back on error
         try:
-            # Will just ignore it if it already exists
-            self.db.cursor.execute(
-                "INSERT OR IGNORE INTO bible_characters (name) VALUES (?)",
-                (name,)
-            )
-            self.db.conn.commit()
-
-            # Get the ID of the character,
-            #   whether it was just added or already existed
-            self.db.cursor.execute(
-                "SELECT id FROM bible_characters WHERE name = ?",
-                (name,)
-            )
-            row = self.db.cursor.fetchone()
-            character_id = row[0] if row else None
+            with self.db.transaction():
+                # The no-op update on conflict makes RETURNING give the ID,
+                #   whether it was just added or already existed
+                cursor.execute(
+                    """
+                    INSERT INTO bible_characters (name) VALUES (?)
+                    ON CONFLICT(name) DO UPDATE SET name = name
+                    RETURNING id
+                    """,
+                    (name,)
+                )
+                character_id = cursor.fetchone()[0]
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"CharacterManager.add: "
                 f"An error occurred while adding the character:\n{e}"
             )
-            self.db.conn.rollback()
             return None
 
+        # Only cache once the row is committed
+        if self.db.committed():
+            self._id_cache[name] = character_id
         return character_id
 
     def update(
@@ -2327,36 +4923,43 @@ class CharacterManager:
                 Or None if an error occurs.
         """
 
+        cursor = self.db.conn.cursor()
+
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print("CharacterManager.update: Invalid character name provided.")
+        if not _nonblank(name):
+            logger.warning(
+                "CharacterManager.update: Invalid character name provided."
+            )
             return None
 
         # Update the entry
         try:
-            self.db.cursor.execute(
+            cursor.execute(
                 "UPDATE bible_characters SET name = ? WHERE id = ?",
                 (name, id)
             )
 
             # Check if any rows were affected
-            if self.db.cursor.rowcount == 0:
-                print(
+            if cursor.rowcount == 0:
+                logger.warning(
                     f"CharacterManager.update: "
                     f"No character found with ID {id}."
                 )
-                self.db.conn.rollback()
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
+
+            # The cached name for this ID may be stale now
+            self._id_cache.clear()
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"CharacterManager.update: "
                 f"An error occurred while updating the character:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
@@ -2378,30 +4981,35 @@ class CharacterManager:
                 Or None if an error occurs.
         """
 
+        cursor = self.db.conn.cursor()
+
         try:
-            self.db.cursor.execute(
+            cursor.execute(
                 "DELETE FROM bible_characters WHERE id = ?",
                 (id,)
             )
 
             # Check if any rows were affected
-            if self.db.cursor.rowcount == 0:
-                print(
+            if cursor.rowcount == 0:
+                logger.warning(
                     f"CharacterManager.delete: "
                     f"No character found with ID {id}."
                 )
-                self.db.conn.rollback()
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
 
-        except Exception as e:
-            print(
-                f"CharacterManager.update: "
-                f"An error occurred while updating the character:\n{e}"
+            # The cached name for this ID may be stale now
+            self._id_cache.clear()
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"CharacterManager.delete: "
+                f"An error occurred while deleting the character:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
@@ -2425,25 +5033,62 @@ class CharacterManager:
                 Or a None if an error occurs.
         """
 
+        # Convert to a list of dictionaries, even for a single character
+        try:
+            items = list(self.get_iter(id))
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"CharacterManager.get: "
+                f"An error occurred while retrieving characters:\n{e}"
+            )
+            return None
+
+        return items
+
+    def get_iter(
+        self,
+        id: int | None = None,
+    ) -> Iterator[dict]:
+        """
+        Lazily yields characters from the database.
+            Rows are read from SQLite as they are consumed,
+            rather than building a full list up front.
+
+        Args:
+            id (int | None): The ID of the character to retrieve.
+                If None, yields all characters. Defaults to None.
+
+        Yields:
+            dict: The character details, one row at a time.
+        """
+
+        # Use a dedicated cursor, so other calls on the shared cursor
+        #   can't reset it part way through iteration
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
         # Fetch all
         if id is None:
-            query = self.db.cursor.execute("SELECT * FROM bible_characters")
+            cursor.execute(
+                """
+                SELECT id, name, profile_pic, date_range, description
+                FROM bible_characters
+                """
+            )
 
         # Fetch a single item by ID
         else:
-            query = self.db.cursor.execute(
-                "SELECT * FROM bible_characters WHERE id = ?",
+            cursor.execute(
+                """
+                SELECT id, name, profile_pic, date_range, description
+                FROM bible_characters WHERE id = ?
+                """,
                 (id,)
             )
 
-        # Convert to a list of dictionaries, even for a single item
-        try:
-            items = [dict(row) for row in query.fetchall()]
-
-        except Exception:
-            return None
-
-        return items
+        for row in cursor:
+            yield self._row_to_dict(row)
 
     def get_from_video(
         self,
@@ -2463,21 +5108,120 @@ class CharacterManager:
         """
 
         try:
-            self.db.cursor.execute(
+            items = list(self.iter_from_video(video_id))
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"Error retrieving characters for video {video_id}: {e}"
+            )
+            return None
+
+        return items
+
+    def iter_from_video(
+        self,
+        video_id: int,
+    ) -> Iterator[dict]:
+        """
+        Lazily yields characters associated with a specific video.
+            Rows are read from SQLite as they are consumed,
+            rather than building a full list up front.
+
+        Args:
+            video_id (int): The ID of the video for which to
+                retrieve characters.
+
+        Yields:
+            dict: The character details, one row at a time.
+        """
+
+        # Use a dedicated cursor, so other calls on the shared cursor
+        #   can't reset it part way through iteration
+        #   Plain tuple rows are cheaper than sqlite3.Row here,
+        #   as the columns are known
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(
+            """
+            SELECT c.id, c.name, c.profile_pic, c.date_range, c.description
+            FROM bible_characters c
+            JOIN videos_bible_characters vc ON c.id = vc.character_id
+            WHERE vc.video_id = ?
+            """,
+            (video_id,)
+        )
+        for row in cursor:
+            yield self._row_to_dict(row)
+
+    def get_from_videos(
+        self,
+        video_ids: list[int],
+    ) -> dict[int, list[dict]] | None:
+        """
+        Retrieves characters for several videos in a single query.
+            Avoids calling get_from_video once per video.
+
+        Args:
+            video_ids (list[int]): The IDs of the videos for which to
+                retrieve characters.
+
+        Returns:
+            dict[int, list[dict]] | None:
+                Video IDs mapped to a list of character details.
+                Videos without characters are not included.
+                Or None if an error occurs.
+        """
+
+        if not video_ids:
+            return {}
+
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
+        try:
+            cursor.execute(
                 """
-                SELECT c.* FROM bible_characters c
+                SELECT vc.video_id, c.id, c.name, c.profile_pic,
+                    c.date_range, c.description
+                FROM bible_characters c
                 JOIN videos_bible_characters vc ON c.id = vc.character_id
-                WHERE vc.video_id = ?
+                WHERE vc.video_id IN (SELECT value FROM json_each(?))
                 """,
-                (video_id,)
+                (json.dumps(list(video_ids)),)
             )
-            items = [dict(row) for row in self.db.cursor.fetchall()]
 
-        except Exception as e:
-            print(f"Error retrieving characters for video {video_id}: {e}")
+            # Group the characters by video
+            items = defaultdict(list)
+            for row in cursor:
+                items[row[0]].append(self._row_to_dict(row[1:]))
+
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving characters for videos: {e}")
             return None
 
-        return items
+        return dict(items)
+
+    @staticmethod
+    def _row_to_dict(
+        row: tuple,
+    ) -> dict:
+        """
+        Converts a plain character row to a dictionary.
+
+        Args:
+            row (tuple): id, name, profile_pic, date_range, description
+
+        Returns:
+            dict: The character details.
+        """
+
+        return {
+            "id": row[0],
+            "name": row[1],
+            "profile_pic": row[2],
+            "date_range": row[3],
+            "description": row[4],
+        }
 
     def add_to_video(
         self,
@@ -2497,39 +5241,172 @@ class CharacterManager:
         Returns:
             bool:
                 True if the character was successfully added to the video.
-                False if an error occurs or the association already exists.
+                False if an error occurs, or either ID doesn't exist.
         """
 
-        # Verify video exists
-        self.db.cursor.execute(
-            "SELECT 1 FROM videos WHERE id = ?", (video_id,)
-        )
-        if not self.db.cursor.fetchone():
-            print(f"Video with ID {video_id} does not exist.")
+        cursor = self.db.conn.cursor()
+
+        # Link them in one statement
+        #   Selecting from both tables means nothing is inserted
+        #   if either ID doesn't exist
+        try:
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO videos_bible_characters
+                    (video_id, character_id)
+                SELECT v.id, x.id FROM videos v, bible_characters x
+                WHERE v.id = ? AND x.id = ?
+                """, (video_id, character_id)
+            )
+            added = cursor.rowcount
+            self.db.commit()
+
+            # Nothing was added, so either the link already exists,
+            #   or one of the IDs is invalid
+            if not added:
+                cursor.execute(
+                    """
+                    SELECT
+                        EXISTS (SELECT 1 FROM videos WHERE id = ?),
+                        EXISTS (SELECT 1 FROM bible_characters WHERE id = ?)
+                    """, (video_id, character_id)
+                )
+                video_exists, character_exists = cursor.fetchone()
+
+        except sqlite3.Error as e:
+            self.db.rollback()
+            logger.error(f"Error linking a character to video: {e}")
             return False
 
-        # Verify character exists
-        self.db.cursor.execute(
-            "SELECT 1 FROM bible_characters WHERE id = ?", (character_id,)
-        )
-        if not self.db.cursor.fetchone():
-            print(f"character with ID {character_id} does not exist.")
+        if added:
+            return True
+
+        if not video_exists:
+            logger.warning(f"Video with ID {video_id} does not exist.")
+            return False
+
+        if not character_exists:
+            logger.warning(f"Character with ID {character_id} does not exist.")
+            return False
+
+        return True
+
+    def add_to_video_by_name(
+        self,
+        video_id: int,
+        name: str,
+    ) -> bool:
+        """
+        Adds a character to a video, using the character's name.
+            The character is created if it doesn't already exist.
+
+        Args:
+            video_id (int): The ID of the video to which the character
+                will be added.
+            name (str): The name of the character to add to the video.
+
+        Returns:
+            bool:
+                True if the character was successfully added to the video.
+                False if an error occurs.
+        """
+
+        cursor = self.db.conn.cursor()
+
+        # Check that 'name' is a valid non-empty string
+        if not _nonblank(name):
+            logger.warning(
+                "CharacterManager.add_to_video_by_name: "
+                "Invalid character name provided."
+            )
             return False
 
         try:
-            self.db.cursor.execute(
-                """
-                INSERT OR
-                IGNORE INTO videos_bible_characters (video_id, character_id)
-                VALUES (?, ?)
-                """, (video_id, character_id)
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
+            )
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
+
+            with self.db.transaction():
+                # A cached ID means only the link needs inserting
+                character_id = _link_by_name(
+                    cursor, "bible_characters", "videos_bible_characters",
+                    "character_id", video_id, name,
+                    item_id=self._id_cache.get(name),
+                )
+
+            # Only cache once the row is committed
+            #   An outer transaction may still roll it back
+            if self.db.committed():
+                self._id_cache[name] = character_id
+            return True
+
+        except sqlite3.Error as e:
+            logger.error(f"Error linking a character to video: {e}")
+            return False
+
+    def add_many_to_video_by_name(
+        self,
+        video_id: int,
+        names: list[str],
+    ) -> bool:
+        """
+        Adds several characters to a video, using their names.
+            Any characters that don't exist yet are created.
+            Everything happens in one transaction, with one commit.
+
+        Args:
+            video_id (int): The ID of the video to which the characters
+                will be added.
+            names (list[str]): The names of the characters to add.
+
+        Returns:
+            bool:
+                True if the characters were successfully added to the video.
+                False if an error occurs.
+        """
+
+        # Check that each 'name' is a valid non-empty string
+        for name in names:
+            if not _nonblank(name):
+                logger.warning(
+                    "CharacterManager.add_many_to_video_by_name: "
+                    "Invalid character name provided."
+                )
+                return False
+
+        if not names:
+            return True
+
+        cursor = self.db.conn.cursor()
+
+        try:
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
             )
-            self.db.conn.commit()
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
+
+            with self.db.transaction():
+                # Add any new characters, then link them all to the video
+                ids = _link_many_by_name(
+                    cursor, "bible_characters", "videos_bible_characters",
+                    "character_id", video_id, names
+                )
+
+            # Only cache once the rows are committed
+            #   An outer transaction may still roll them back
+            if self.db.committed():
+                self._id_cache.update(ids)
             return True
 
-        except Exception as e:
-            self.db.conn.rollback()
-            print(f"Error linking a character to video: {e}")
+        except sqlite3.Error as e:
+            logger.error(f"Error linking characters to video: {e}")
             return False
 
     def remove_from_video(
@@ -2553,8 +5430,10 @@ class CharacterManager:
                 False if an error occurs or the association does not exist.
         """
 
+        cursor = self.db.conn.cursor()
+
         try:
-            self.db.cursor.execute(
+            cursor.execute(
                 """
                 DELETE FROM videos_bible_characters
                 WHERE video_id = ?
@@ -2562,12 +5441,99 @@ class CharacterManager:
                 """,
                 (video_id, character_id)
             )
-            self.db.conn.commit()
+            self.db.commit()
+            return True
+
+        except sqlite3.Error as e:
+            self.db.rollback()
+            logger.error(f"Error unlinking character from video: {e}")
+            return False
+
+    def add_many_to_video(
+        self,
+        video_id: int,
+        character_ids: list[int],
+    ) -> bool:
+        """
+        Adds several characters to a video at once.
+            All links are inserted by one statement, with one commit.
+            Existing links are left as they are.
+
+        Args:
+            video_id (int): The ID of the video to which the characters
+                will be added.
+            character_ids (list[int]): The IDs of the characters to add.
+                IDs that don't exist are ignored.
+
+        Returns:
+            bool:
+                True if the characters were successfully added to the video.
+                False if an error occurs or the video doesn't exist.
+        """
+
+        cursor = self.db.conn.cursor()
+
+        try:
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
+            )
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
+
+            with self.db.transaction():
+                cursor.execute(
+                    """
+                    INSERT OR IGNORE INTO videos_bible_characters
+                        (video_id, character_id)
+                    SELECT ?, id FROM bible_characters
+                    WHERE id IN (SELECT value FROM json_each(?))
+                    """,
+                    (video_id, json.dumps(list(character_ids)))
+                )
+            return True
+
+        except sqlite3.Error as e:
+            logger.error(f"Error linking characters to video: {e}")
+            return False
+
+    def remove_many_from_video(
+        self,
+        video_id: int,
+        character_ids: list[int],
+    ) -> bool:
+        """
+        Removes several characters from a video at once.
+            All links are deleted by one statement, with one commit.
+
+        Args:
+            video_id (int): The ID of the video from which the characters
+                will be removed.
+            character_ids (list[int]): The IDs of the characters to remove.
+
+        Returns:
+            bool:
+                True if the statement succeeded.
+                False if an error occurs.
+        """
+
+        cursor = self.db.conn.cursor()
+
+        try:
+            with self.db.transaction():
+                cursor.execute(
+                    """
+                    DELETE FROM videos_bible_characters
+                    WHERE video_id = ?
+                    AND character_id IN (SELECT value FROM json_each(?))
+                    """,
+                    (video_id, json.dumps(list(character_ids)))
+                )
             return True
 
-        except Exception as e:
-            self.db.conn.rollback()
-            print(f"Error unlinking character from video: {e}")
+        except sqlite3.Error as e:
+            logger.error(f"Error unlinking characters from video: {e}")
             return False
 
     def name_to_id(
@@ -2586,26 +5552,59 @@ class CharacterManager:
                 None if the character does not exist.
         """
 
+        cursor = self.db.conn.cursor()
+
         # Check that 'name' is a valid non-empty string
-        if not isinstance(name, str) or not name.strip():
-            print(
+        if not _nonblank(name):
+            logger.warning(
                 "CharacterManager.name_to_id: Invalid character name provided."
             )
             return None
 
         try:
-            self.db.cursor.execute(
+            cursor.execute(
                 "SELECT id FROM bible_characters WHERE name = ?",
                 (name,)
             )
-            result = self.db.cursor.fetchone()
+            result = cursor.fetchone()
 
             # There should be only one result, or nothing
             return result[0] if result else None
 
-        except Exception as e:
-            print(f"CharacterManager.name_to_id: An error occurred while "
-                  f"resolving character name '{name}' to ID:\n{e}")
+        except sqlite3.Error as e:
+            logger.error(
+                f"CharacterManager.name_to_id: An error occurred while "
+                f"resolving character name '{name}' to ID:\n{e}"
+            )
+            return None
+
+    def names_to_ids(
+        self,
+        names: list[str],
+    ) -> dict[str, int] | None:
+        """
+        Resolve several character names to their IDs at once.
+            This is much faster than calling 'name_to_id' for each name.
+
+        Args:
+            names (list[str]): The names of the characters.
+
+        Returns:
+            dict[str, int] | None:
+                A mapping of name to ID. Names that don't exist are left out.
+                Or None if an error occurs.
+        """
+
+        try:
+            return _ids_by_name(
+                self.db.conn.cursor(), "bible_characters", names
+            )
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"CharacterManager.names_to_ids: An error occurred while "
+                f"resolving character names to IDs:\n{e}"
+            )
             return None
 
 
@@ -2613,10 +5612,17 @@ class ScriptureManager:
     """
     A class for managing scripture-related operations in the database.
         - Add/Update/Delete scripture
-        - Add/Update/Remove scripture to/from videos
+        - Add/Update/Remove scripture to/from videos, one or many at a time
         - Get scripture (all, assigned to a video)
         - Resolve tag name to ID
 
+    Each method uses its own cursor on the shared connection,
+        so one call can't clobber the results of another.
+
+    Scripture IDs are cached by (book, chapter, verse) as they are added
+        or looked up, so repeated adds and lookups (common in bulk
+        imports) skip SQLite.
+
     Args:
         db (DatabaseContext):
             An instance of DatabaseContext for database operations.
@@ -2641,6 +5647,9 @@ class ScriptureManager:
 
         self.db = db
 
+        # (book, chapter, verse) -> ID, filled as scriptures are added
+        self._id_cache: dict[tuple[str, int, int], int] = {}
+
     def add(
         self,
         book: str,
@@ -2662,44 +5671,124 @@ class ScriptureManager:
         """
 
         # Check that 'name' is a valid non-empty string
-        if not isinstance(book, str) or not book.strip():
-            print("ScriptureManager.add: Invalid book name provided.")
+        if not _nonblank(book):
+            logger.warning("ScriptureManager.add: Invalid book name provided.")
             return None
 
+        # Already seen, so it exists
+        key = (book, chapter, verse)
+        if key in self._id_cache:
+            return self._id_cache[key]
+
+        cursor = self.db.conn.cursor()
+
         # Add the entry
+        #   The transaction commits once on success,
+        #   or rolls back on error
         try:
-            # Will just ignore it if it already exists
-            self.db.cursor.execute(
-                """
-                INSERT OR IGNORE INTO scriptures (book, chapter, verse)
-                VALUES (?, ?, ?)
-                """,
-                (book, chapter, verse)
-            )
-            self.db.conn.commit()
-
-            # Get the ID of the scripture,
-            #   whether it was just added or already existed
-            self.db.cursor.execute(
-                """
-                SELECT id FROM scriptures
-                WHERE book = ? AND chapter = ? AND verse = ?
-                """,
-                (book, chapter, verse)
-            )
-            row = self.db.cursor.fetchone()
-            scripture_id = row[0] if row else None
+            with self.db.transaction():
+                # The no-op update on conflict makes RETURNING give the ID,
+                #   whether it was just added or already existed
+                cursor.execute(
+                    """
+                    INSERT INTO scriptures (book, chapter, verse)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(book, chapter, verse) DO UPDATE SET book = book
+                    RETURNING id
+                    """,
+                    key
+                )
+                scripture_id = cursor.fetchone()[0]
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"ScriptureManager.add: "
                 f"An error occurred while adding the scripture:\n{e}"
             )
-            self.db.conn.rollback()
             return None
 
+        # Only cache once the row is committed
+        if self.db.committed():
+            self._id_cache[key] = scripture_id
         return scripture_id
 
+    def add_many(
+        self,
+        rows: list[tuple[str, int, int]],
+    ) -> list[int] | None:
+        """
+        Adds several scriptures to the database in one transaction.
+            Any that already exist are left as they are.
+            If any can't be added, none of them are, even inside an
+            open transaction.
+            Useful for bulk imports, such as whole chapters or books.
+
+        Args:
+            rows (list[tuple[str, int, int]]): The scriptures to add,
+                as (book, chapter, verse) tuples.
+
+        Returns:
+            list[int] | None:
+                The IDs of the scriptures, in the same order as 'rows'.
+                Or None if an error occurs.
+        """
+
+        # Check that each 'book' is a valid non-empty string
+        for book, _, _ in rows:
+            if not _nonblank(book):
+                logger.warning(
+                    "ScriptureManager.add_many: Invalid book name provided."
+                )
+                return None
+
+        # Match the types SQLite stores, and gives back from RETURNING,
+        #   so each row can be found in the results
+        try:
+            keys = [
+                (book, int(chapter), int(verse))
+                for book, chapter, verse in rows
+            ]
+
+        except (TypeError, ValueError):
+            logger.warning(
+                "ScriptureManager.add_many: Invalid chapter or verse provided."
+            )
+            return None
+
+        cursor = self.db.conn.cursor()
+
+        # Add the entries
+        #   The transaction commits once on success,
+        #   or rolls back on error
+        try:
+            with self.db.transaction():
+                # The no-op update on conflict makes RETURNING give
+                #   the IDs, whether just added or already existing
+                returned = _insert_rows(
+                    cursor,
+                    "INSERT INTO scriptures (book, chapter, verse)",
+                    keys,
+                    "ON CONFLICT(book, chapter, verse) DO UPDATE "
+                    "SET book = book RETURNING book, chapter, verse, id"
+                )
+                ids = {
+                    (book, chapter, verse): id
+                    for book, chapter, verse, id in returned
+                }
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"ScriptureManager.add_many: "
+                f"An error occurred while adding the scriptures:\n{e}"
+            )
+            return None
+
+        # Only cache once the rows are committed
+        #   An outer transaction may still roll them back
+        if self.db.committed():
+            self._id_cache.update(ids)
+        return [ids[key] for key in keys]
+
     def update(
         self,
         id: int,
@@ -2727,53 +5816,48 @@ class ScriptureManager:
                 Or None if an error occurs.
         """
 
-        # Build the update statement dynamically
-        #   based on provided (non-empty) values
-        fields = []
-        values = []
-
-        if book:
-            fields.append("book = ?")
-            values.append(book)
-        if chapter:
-            fields.append("chapter = ?")
-            values.append(chapter)
-        if verse:
-            fields.append("verse = ?")
-            values.append(verse)
-        if text:
-            fields.append("verse_text = ?")
-            values.append(text)
+        cursor = self.db.conn.cursor()
 
-        if not fields:
-            print("ScriptureManager.update: No fields to update.")
+        if not (book or chapter or verse or text):
+            logger.warning("ScriptureManager.update: No fields to update.")
             return None
 
-        # Set up the query
-        values.append(id)
-        query = f"UPDATE scriptures SET {', '.join(fields)} WHERE id = ?"
-
+        # Empty values ('' or 0) leave the column as it is
+        #   As the SQL never changes, SQLite only needs to prepare it once
         try:
-            self.db.cursor.execute(query, tuple(values))
+            cursor.execute(
+                """
+                UPDATE scriptures SET
+                    book = COALESCE(NULLIF(?, ''), book),
+                    chapter = COALESCE(NULLIF(?, 0), chapter),
+                    verse = COALESCE(NULLIF(?, 0), verse),
+                    verse_text = COALESCE(NULLIF(?, ''), verse_text)
+                WHERE id = ?
+                """,
+                (book, chapter, verse, text, id)
+            )
 
             # Check if any rows were affected
-            if self.db.cursor.rowcount == 0:
-                print(
+            if cursor.rowcount == 0:
+                logger.warning(
                     f"ScriptureManager.update: "
                     f"No scripture found with ID {id}."
                 )
-                self.db.conn.rollback()
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
+
+            # The cached reference for this ID may be stale now
+            self._id_cache.clear()
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"ScriptureManager.update: "
                 f"An error occurred while updating the scripture:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
@@ -2795,30 +5879,35 @@ class ScriptureManager:
                 Or None if an error occurs.
         """
 
+        cursor = self.db.conn.cursor()
+
         try:
-            self.db.cursor.execute(
+            cursor.execute(
                 "DELETE FROM scriptures WHERE id = ?",
                 (id,)
             )
 
             # Check if any rows were affected
-            if self.db.cursor.rowcount == 0:
-                print(
+            if cursor.rowcount == 0:
+                logger.warning(
                     f"ScriptureManager.delete: "
                     f"No scripture found with ID {id}."
                 )
-                self.db.conn.rollback()
+                self.db.rollback()
                 return None
 
             # If good, commit the changes
-            self.db.conn.commit()
+            self.db.commit()
 
-        except Exception as e:
-            print(
-                f"ScriptureManager.update: "
-                f"An error occurred while updating the scripture:\n{e}"
+            # The cached reference for this ID may be stale now
+            self._id_cache.clear()
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"ScriptureManager.delete: "
+                f"An error occurred while deleting the scripture:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return None
 
         return id
@@ -2842,25 +5931,59 @@ class ScriptureManager:
                 Or a None if an error occurs.
         """
 
+        # Convert to a list of dictionaries, even for a single scripture
+        try:
+            items = list(self.get_iter(id))
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"ScriptureManager.get: "
+                f"An error occurred while retrieving scriptures:\n{e}"
+            )
+            return None
+
+        return items
+
+    def get_iter(
+        self,
+        id: int | None = None,
+    ) -> Iterator[dict]:
+        """
+        Lazily yields scriptures from the database.
+            Rows are read from SQLite as they are consumed,
+            rather than building a full list up front.
+
+        Args:
+            id (int | None): The ID of the scripture to retrieve.
+                If None, yields all scriptures. Defaults to None.
+
+        Yields:
+            dict: The scripture details, one row at a time.
+        """
+
+        # Use a dedicated cursor, so other calls on the shared cursor
+        #   can't reset it part way through iteration
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
         # Fetch all
         if id is None:
-            query = self.db.cursor.execute("SELECT * FROM scriptures")
+            cursor.execute(
+                "SELECT id, book, chapter, verse, verse_text FROM scriptures"
+            )
 
         # Fetch a single item by ID
         else:
-            query = self.db.cursor.execute(
-                "SELECT * FROM scriptures WHERE id = ?",
+            cursor.execute(
+                """
+                SELECT id, book, chapter, verse, verse_text
+                FROM scriptures WHERE id = ?
+                """,
                 (id,)
             )
 
-        # Convert to a list of dictionaries, even for a single item
-        try:
-            items = [dict(row) for row in query.fetchall()]
-
-        except Exception:
-            return None
-
-        return items
+        for row in cursor:
+            yield self._row_to_dict(row)
 
     def get_from_video(
         self,
@@ -2880,21 +6003,120 @@ class ScriptureManager:
         """
 
         try:
-            self.db.cursor.execute(
+            items = list(self.iter_from_video(video_id))
+
+        except sqlite3.Error as e:
+            logger.error(
+                f"Error retrieving scriptures for video {video_id}: {e}"
+            )
+            return None
+
+        return items
+
+    def iter_from_video(
+        self,
+        video_id: int,
+    ) -> Iterator[dict]:
+        """
+        Lazily yields scriptures associated with a specific video.
+            Rows are read from SQLite as they are consumed,
+            rather than building a full list up front.
+
+        Args:
+            video_id (int): The ID of the video for which to
+                retrieve scriptures.
+
+        Yields:
+            dict: The scripture details, one row at a time.
+        """
+
+        # Use a dedicated cursor, so other calls on the shared cursor
+        #   can't reset it part way through iteration
+        #   Plain tuple rows are cheaper than sqlite3.Row here,
+        #   as the columns are known
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(
+            """
+            SELECT s.id, s.book, s.chapter, s.verse, s.verse_text
+            FROM scriptures s
+            JOIN videos_scriptures vs ON s.id = vs.scripture_id
+            WHERE vs.video_id = ?
+            """,
+            (video_id,)
+        )
+        for row in cursor:
+            yield self._row_to_dict(row)
+
+    def get_from_videos(
+        self,
+        video_ids: list[int],
+    ) -> dict[int, list[dict]] | None:
+        """
+        Retrieves scriptures for several videos in a single query.
+            Avoids calling get_from_video once per video.
+
+        Args:
+            video_ids (list[int]): The IDs of the videos for which to
+                retrieve scriptures.
+
+        Returns:
+            dict[int, list[dict]] | None:
+                Video IDs mapped to a list of scripture details.
+                Videos without scriptures are not included.
+                Or None if an error occurs.
+        """
+
+        if not video_ids:
+            return {}
+
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+
+        try:
+            cursor.execute(
                 """
-                SELECT s.* FROM scriptures s
+                SELECT vs.video_id, s.id, s.book, s.chapter, s.verse,
+                    s.verse_text
+                FROM scriptures s
                 JOIN videos_scriptures vs ON s.id = vs.scripture_id
-                WHERE vs.video_id = ?
+                WHERE vs.video_id IN (SELECT value FROM json_each(?))
                 """,
-                (video_id,)
+                (json.dumps(list(video_ids)),)
             )
-            items = [dict(row) for row in self.db.cursor.fetchall()]
 
-        except Exception as e:
-            print(f"Error retrieving scriptures for video {video_id}: {e}")
+            # Group the scriptures by video
+            items = defaultdict(list)
+            for row in cursor:
+                items[row[0]].append(self._row_to_dict(row[1:]))
+
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving scriptures for videos: {e}")
             return None
 
-        return items
+        return dict(items)
+
+    @staticmethod
+    def _row_to_dict(
+        row: tuple,
+    ) -> dict:
+        """
+        Converts a plain scripture row to a dictionary.
+
+        Args:
+            row (tuple): id, book, chapter, verse, verse_text
+
+        Returns:
+            dict: The scripture details.
+        """
+
+        return {
+            "id": row[0],
+            "book": row[1],
+            "chapter": row[2],
+            "verse": row[3],
+            "verse_text": row[4],
+        }
 
     def add_to_video(
         self,
@@ -2914,41 +6136,175 @@ class ScriptureManager:
         Returns:
             bool:
                 True if the scripture was successfully added to the video.
-                False if an error occurs or the association already exists.
+                False if an error occurs, or either ID doesn't exist.
         """
 
-        # Verify video exists
-        self.db.cursor.execute(
-            "SELECT 1 FROM videos WHERE id = ?", (video_id,)
-        )
-        if not self.db.cursor.fetchone():
-            print(f"Video with ID {video_id} does not exist.")
+        cursor = self.db.conn.cursor()
+
+        # Link them in one statement
+        #   Selecting from both tables means nothing is inserted
+        #   if either ID doesn't exist
+        try:
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO videos_scriptures
+                    (video_id, scripture_id)
+                SELECT v.id, x.id FROM videos v, scriptures x
+                WHERE v.id = ? AND x.id = ?
+                """, (video_id, scripture_id)
+            )
+            added = cursor.rowcount
+            self.db.commit()
+
+            # Nothing was added, so either the link already exists,
+            #   or one of the IDs is invalid
+            if not added:
+                cursor.execute(
+                    """
+                    SELECT
+                        EXISTS (SELECT 1 FROM videos WHERE id = ?),
+                        EXISTS (SELECT 1 FROM scriptures WHERE id = ?)
+                    """, (video_id, scripture_id)
+                )
+                video_exists, scripture_exists = cursor.fetchone()
+
+        except sqlite3.Error as e:
+            self.db.rollback()
+            logger.error(f"Error linking a scripture to video: {e}")
             return False
 
-        # Verify scripture exists
-        self.db.cursor.execute(
-            "SELECT 1 FROM scriptures WHERE id = ?", (scripture_id,)
-        )
-        if not self.db.cursor.fetchone():
-            print(f"Scripture with ID {scripture_id} does not exist.")
+        if added:
+            return True
+
+        if not video_exists:
+            logger.warning(f"Video with ID {video_id} does not exist.")
+            return False
+
+        if not scripture_exists:
+            logger.warning(f"Scripture with ID {scripture_id} does not exist.")
+            return False
+
+        return True
+
+    def add_range_to_video(
+        self,
+        video_id: int,
+        book: str,
+        chapter: int,
+        start_verse: int,
+        end_verse: int,
+    ) -> bool:
+        """
+        Adds a range of verses (eg, John 3:16-18) to a video.
+            Scriptures are created if they don't already exist.
+            All verses are added in a single transaction.
+
+        Args:
+            video_id (int): The ID of the video to which the scriptures
+                will be added.
+            book (str): The name of the book.
+            chapter (int): The chapter number.
+            start_verse (int): The first verse in the range.
+            end_verse (int): The last verse in the range (inclusive).
+
+        Returns:
+            bool:
+                True if the scriptures were successfully added to the video.
+                False if an error occurs.
+        """
+
+        cursor = self.db.conn.cursor()
+
+        # Check that 'book' is a valid non-empty string
+        if not _nonblank(book):
+            logger.warning(
+                "ScriptureManager.add_range_to_video: "
+                "Invalid book name provided."
+            )
+            return False
+
+        if start_verse > end_verse:
+            logger.warning(
+                f"ScriptureManager.add_range_to_video: Invalid verse range "
+                f"{start_verse}-{end_verse}."
+            )
             return False
 
+        # Both statements run in one transaction, with one commit
+        #   If either fails, neither is kept, even in an outer transaction
         try:
-            self.db.cursor.execute(
-                """
-                INSERT OR
-                IGNORE INTO videos_scriptures (video_id, scripture_id)
-                VALUES (?, ?)
-                """, (video_id, scripture_id)
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
             )
-            self.db.conn.commit()
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
+
+            with self.db.transaction():
+                # Parameters are generated as they are bound,
+                #   so no list of tuples is built first
+                cursor.executemany(
+                    """
+                    INSERT OR IGNORE INTO scriptures (book, chapter, verse)
+                    VALUES (?, ?, ?)
+                    """,
+                    (
+                        (book, chapter, verse)
+                        for verse in range(start_verse, end_verse + 1)
+                    )
+                )
+
+                # Link the whole range with one statement
+                cursor.execute(
+                    """
+                    INSERT OR IGNORE INTO videos_scriptures
+                        (video_id, scripture_id)
+                    SELECT ?, id FROM scriptures
+                    WHERE book = ? AND chapter = ?
+                        AND verse BETWEEN ? AND ?
+                    """,
+                    (video_id, book, chapter, start_verse, end_verse)
+                )
             return True
 
-        except Exception as e:
-            self.db.conn.rollback()
-            print(f"Error linking a scripture to video: {e}")
+        except sqlite3.Error as e:
+            logger.error(f"Error linking a scripture range to video: {e}")
             return False
 
+    def add_to_video_by_reference(
+        self,
+        video_id: int,
+        book: str,
+        chapter: int,
+        verse: int,
+    ) -> bool:
+        """
+        Adds a single scripture to a video, using the book, chapter and verse.
+            The scripture is created if it doesn't already exist.
+            This is a range of one verse.
+
+        Args:
+            video_id (int): The ID of the video to which the scripture
+                will be added.
+            book (str): The name of the book.
+            chapter (int): The chapter number.
+            verse (int): The verse number.
+
+        Returns:
+            bool:
+                True if the scripture was successfully added to the video.
+                False if an error occurs.
+        """
+
+        return self.add_range_to_video(
+            video_id=video_id,
+            book=book,
+            chapter=chapter,
+            start_verse=verse,
+            end_verse=verse,
+        )
+
     def remove_from_video(
         self,
         video_id: int,
@@ -2970,8 +6326,10 @@ class ScriptureManager:
                 False if an error occurs or the association does not exist.
         """
 
+        cursor = self.db.conn.cursor()
+
         try:
-            self.db.cursor.execute(
+            cursor.execute(
                 """
                 DELETE FROM videos_scriptures
                 WHERE video_id = ?
@@ -2979,12 +6337,99 @@ class ScriptureManager:
                 """,
                 (video_id, scripture_id)
             )
-            self.db.conn.commit()
+            self.db.commit()
+            return True
+
+        except sqlite3.Error as e:
+            self.db.rollback()
+            logger.error(f"Error unlinking scripture from video: {e}")
+            return False
+
+    def add_many_to_video(
+        self,
+        video_id: int,
+        scripture_ids: list[int],
+    ) -> bool:
+        """
+        Adds several scriptures to a video at once.
+            All links are inserted by one statement, with one commit.
+            Existing links are left as they are.
+
+        Args:
+            video_id (int): The ID of the video to which the scriptures
+                will be added.
+            scripture_ids (list[int]): The IDs of the scriptures to add.
+                IDs that don't exist are ignored.
+
+        Returns:
+            bool:
+                True if the scriptures were successfully added to the video.
+                False if an error occurs or the video doesn't exist.
+        """
+
+        cursor = self.db.conn.cursor()
+
+        try:
+            # Verify video exists
+            cursor.execute(
+                "SELECT 1 FROM videos WHERE id = ?", (video_id,)
+            )
+            if not cursor.fetchone():
+                logger.warning(f"Video with ID {video_id} does not exist.")
+                return False
+
+            with self.db.transaction():
+                cursor.execute(
+                    """
+                    INSERT OR IGNORE INTO videos_scriptures
+                        (video_id, scripture_id)
+                    SELECT ?, id FROM scriptures
+                    WHERE id IN (SELECT value FROM json_each(?))
+                    """,
+                    (video_id, json.dumps(list(scripture_ids)))
+                )
+            return True
+
+        except sqlite3.Error as e:
+            logger.error(f"Error linking scriptures to video: {e}")
+            return False
+
+    def remove_many_from_video(
+        self,
+        video_id: int,
+        scripture_ids: list[int],
+    ) -> bool:
+        """
+        Removes several scriptures from a video at once.
+            All links are deleted by one statement, with one commit.
+
+        Args:
+            video_id (int): The ID of the video from which the scriptures
+                will be removed.
+            scripture_ids (list[int]): The IDs of the scriptures to remove.
+
+        Returns:
+            bool:
+                True if the statement succeeded.
+                False if an error occurs.
+        """
+
+        cursor = self.db.conn.cursor()
+
+        try:
+            with self.db.transaction():
+                cursor.execute(
+                    """
+                    DELETE FROM videos_scriptures
+                    WHERE video_id = ?
+                    AND scripture_id IN (SELECT value FROM json_each(?))
+                    """,
+                    (video_id, json.dumps(list(scripture_ids)))
+                )
             return True
 
-        except Exception as e:
-            self.db.conn.rollback()
-            print(f"Error unlinking scripture from video: {e}")
+        except sqlite3.Error as e:
+            logger.error(f"Error unlinking scriptures from video: {e}")
             return False
 
     def name_to_id(
@@ -3010,30 +6455,46 @@ class ScriptureManager:
         """
 
         # Check that 'book' is a valid non-empty string
-        if not isinstance(book, str) or not book.strip():
-            print(
+        if not _nonblank(book):
+            logger.warning(
                 "ScriptureManager.name_to_id: Invalid book name provided."
             )
             return None
 
+        # Already seen, so no need to ask SQLite
+        key = (book, chapter, verse)
+        if key in self._id_cache:
+            return self._id_cache[key]
+
+        cursor = self.db.conn.cursor()
+
         try:
-            self.db.cursor.execute(
+            cursor.execute(
                 """
                 SELECT id FROM scriptures
                 WHERE book = ? AND chapter = ? AND verse = ?
-                """, (book, chapter, verse)
+                """, key
             )
-            result = self.db.cursor.fetchone()
+            result = cursor.fetchone()
 
-            # There should be only one result, or nothing
-            return result[0] if result else None
+        except sqlite3.Error as e:
+            logger.error(
+                f"ScriptureManager.name_to_id: An error occurred while "
+                f"resolving scripture '{book} {chapter}:{verse}' "
+                f"to ID:\n{e}"
+            )
+            return None
 
-        except Exception as e:
-            print(f"ScriptureManager.name_to_id: An error occurred while "
-                  f"resolving scripture '{book} {chapter}:{verse}' "
-                  f"to ID:\n{e}")
+        # There should be only one result, or nothing
+        #   Misses aren't cached, as the scripture may be added later
+        if result is None:
             return None
 
+        # An open transaction may have added it, and may roll it back
+        if self.db.committed():
+            self._id_cache[key] = result[0]
+        return result[0]
+
 
 class SimilarityManager:
     """
@@ -3091,13 +6552,14 @@ class SimilarityManager:
         """
 
         # Validate the video IDs
-        with DatabaseContext() as db:
-            video_mgr = VideoManager(db)
-            for video in (video1_id, video2_id):
-                result = video_mgr.get(id=video)
-                if not result:
-                    logging.error(f"Video with ID {video} does not exist.")
-                    return False
+        #   Use this connection, so videos added in the same
+        #   (uncommitted) transaction are found
+        video_mgr = VideoManager(self.db)
+        for video in (video1_id, video2_id):
+            result = video_mgr.get(id=video)
+            if not result:
+                logger.error(f"Video with ID {video} does not exist.")
+                return False
 
         # Ensure video1_id is always the smaller, video2_id the larger
         smaller_video_id, larger_video_id = sorted((video1_id, video2_id))
@@ -3113,14 +6575,14 @@ class SimilarityManager:
                 """,
                 (smaller_video_id, larger_video_id, score)
             )
-            self.db.conn.commit()
+            self.db.commit()
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"SimilarityManager.add: "
                 f"An error occurred while adding the entry:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return False
 
         return True
@@ -3182,21 +6644,21 @@ class SimilarityManager:
             )
 
             if self.db.cursor.rowcount == 0:
-                print(
+                logger.warning(
                     f"SimilarityManager.delete: "
                     f"No entry found for videos {video1_id} and {video2_id}."
                 )
-                self.db.conn.rollback()
+                self.db.rollback()
                 return False
 
-            self.db.conn.commit()
+            self.db.commit()
 
-        except Exception as e:
-            print(
+        except sqlite3.Error as e:
+            logger.error(
                 f"SimilarityManager.delete: "
                 f"An error occurred while deleting the entry:\n{e}"
             )
-            self.db.conn.rollback()
+            self.db.rollback()
             return False
 
         return True
@@ -3236,13 +6698,11 @@ class SimilarityManager:
                     """,
                     (video1_id, video1_id)
                 )
-                rows = self.db.cursor.fetchall()
-
                 # Convert to a list of dictionaries
-                return [dict(row) for row in rows]
+                return _fetch_dicts(self.db.cursor)
 
-            except Exception as e:
-                print(
+            except sqlite3.Error as e:
+                logger.error(
                     f"SimilarityManager.get: "
                     f"An error occurred while retrieving entries:\n{e}"
                 )
@@ -3253,23 +6713,27 @@ class SimilarityManager:
             # Ensure video1_id is always the smaller, video2_id the larger
             smaller_video_id, larger_video_id = sorted((video1_id, video2_id))
 
+            # The entry is returned as is, so keep name access to it
+            cursor = self.db.conn.cursor()
+            cursor.row_factory = sqlite3.Row
+
             try:
-                self.db.cursor.execute(
+                cursor.execute(
                     """
                     SELECT score FROM video_similarity
                     WHERE video_1_id = ? AND video_2_id = ?
                     """,
                     (smaller_video_id, larger_video_id)
                 )
-                row = self.db.cursor.fetchone()
+                row = cursor.fetchone()
 
                 if row:
                     return row
                 else:
                     return None
 
-            except Exception as e:
-                print(
+            except sqlite3.Error as e:
+                logger.error(
                     f"SimilarityManager.get: "
                     f"An error occurred while retrieving the entry:\n{e}"
                 )
@@ -3277,4 +6741,4 @@ class SimilarityManager:
 
 
 if __name__ == "__main__":
-    print("This is a a class file, and should not be run directly.")
+    logger.warning("This is a a class file, and should not be run directly.")
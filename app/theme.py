@@ -323,7 +323,7 @@ class ThemeManager:
                     video_id = item['video'].get('id')
 
                     # Get video details from the database
-                    with DatabaseContext() as db:
+                    with DatabaseContext(read_only=True) as db:
                         video_mgr = VideoManager(db)
                         details = video_mgr.get(video_id)
 
@@ -344,7 +344,7 @@ class ThemeManager:
                             video_id = grid_item['video'].get('id')
 
                             # Get video details from the database
-                            with DatabaseContext() as db:
+                            with DatabaseContext(read_only=True) as db:
                                 video_mgr = VideoManager(db)
                                 details = video_mgr.get(video_id)
 
@@ -285,7 +285,7 @@ def home() -> Response:
             )
 
     # Get details for each in-progress video
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         video_mgr = VideoManager(db)
 
         for video in in_progress_videos:
@@ -304,9 +304,12 @@ def home() -> Response:
             reverse=True
         )
 
-    # Get latest Monthly Programs video
+    # Get the latest Monthly Programs and News videos
+    #   One category manager serves both lookups,
+    #   so the category names are only loaded once
     monthly = None
-    with DatabaseContext() as db:
+    news = None
+    with DatabaseContext(read_only=True) as db:
         video_mgr = VideoManager(db)
         cat_mgr = CategoryManager(db)
 
@@ -319,12 +322,6 @@ def home() -> Response:
                 latest=1,
             )
 
-    # Get the latest News video
-    news = None
-    with DatabaseContext() as db:
-        video_mgr = VideoManager(db)
-        cat_mgr = CategoryManager(db)
-
         # Get the category ID for 'News and Announcements'
         news_cat = cat_mgr.name_to_id(name='News and Announcements')
 
@@ -339,7 +336,7 @@ def home() -> Response:
 
     # Get the latest videos in general
     latest = None
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         video_mgr = VideoManager(db)
 
         # Get the latest 9 videos
@@ -511,7 +508,7 @@ def edit_profile(profile_id: int) -> Response:
 
     # Get video name and thumbnail for each history item
     if history:
-        with DatabaseContext() as db:
+        with DatabaseContext(read_only=True) as db:
             video_mgr = VideoManager(db)
 
             for item in history:
@@ -565,7 +562,7 @@ def characters() -> Response:
         Response: A rendered HTML page with character details.
     """
 
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         character_mgr = CharacterManager(db)
         characters: List[Dict[str, Any]] = character_mgr.get() or []
 
@@ -602,14 +599,17 @@ def tags() -> Response:
         Response: A rendered HTML page with tag details.
     """
 
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         tag_mgr = TagManager(db)
         video_mgr = VideoManager(db)
         tags: List[Dict[str, Any]] = tag_mgr.get() or []
 
         # Get the video count for each tag
         for tag in tags:
-            videos = video_mgr.get_filter(tag_id=tag['id'])
+            videos = video_mgr.get_filter(
+                tag_id=tag['id'],
+                columns=("id",),
+            )
             tag['video_count'] = len(videos) if videos else 0
 
     # Sort tags by name in a case-insensitive manner
@@ -646,7 +646,7 @@ def location() -> Response:
         Response: A rendered HTML page with location details.
     """
 
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         loc_mgr = LocationManager(db)
         locations: List[Dict[str, Any]] = loc_mgr.get() or []
 
@@ -680,7 +680,7 @@ def speakers() -> Response:
         Response: A rendered HTML page with speaker details.
     """
 
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         speaker_mgr = SpeakerManager(db)
         video_mgr = VideoManager(db)
         speakers = speaker_mgr.get()
@@ -691,7 +691,8 @@ def speakers() -> Response:
         # Get the video count for each speaker
         for speaker in speakers:
             videos = video_mgr.get_filter(
-                speaker_id=speaker['id']
+                speaker_id=speaker['id'],
+                columns=("id",),
             )
             if not videos:
                 return make_response(
@@ -742,7 +743,7 @@ def scriptures() -> Response:
         Response: A rendered HTML page with scripture details.
     """
 
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         scripture_mgr = ScriptureManager(db)
         scriptures: List[Dict[str, Any]] = scripture_mgr.get() or []
 
@@ -99,7 +99,7 @@ def render_category_page(
     )
 
     # Get an ID for the main category
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         cat_mgr = CategoryManager(db)
         main_cat_id = cat_mgr.name_to_id(name=category_name)
 
@@ -111,28 +111,41 @@ def render_category_page(
 
         main_cat = {"id": main_cat_id, "name": category_name}
 
+        # Get the subcategory IDs with the same manager,
+        #   so the category names are only loaded once
+        sub_cat_ids = {
+            sub_cat: cat_mgr.name_to_id(name=sub_cat)
+            for sub_cat in sub_category_list
+        }
+
     # Get the active profile from the session
     active_profile = session.get("active_profile", None)
     print(f"Active profile: {active_profile}")
 
-    # Get a list of subcategory IDs
+    # Get the video and watched counts for each subcategory
     watch_status = []
-    with DatabaseContext() as db:
-        cat_mgr = CategoryManager(db)
+    with DatabaseContext(read_only=True) as db:
         video_mgr = VideoManager(db)
 
+        # Get the videos for all subcategories in one query
+        videos_by_cat = video_mgr.get_by_categories(
+            [cat_id for cat_id in sub_cat_ids.values() if cat_id is not None],
+            columns=("id",),
+        )
+
         # Loop through each subcategory name
         for sub_cat in sub_category_list:
             entry = {}
 
-            # Get the subcategory ID from the database
             entry['name'] = sub_cat
-            sub_cat_id = cat_mgr.name_to_id(name=sub_cat)
+            sub_cat_id = sub_cat_ids[sub_cat]
 
             # Add it to the list if found
             if sub_cat_id is not None:
-                video_list = video_mgr.get_filter(
-                    category_id=[sub_cat_id],
+                video_list = (
+                    videos_by_cat.get(sub_cat_id)
+                    if videos_by_cat is not None
+                    else None
                 )
 
                 entry['id'] = sub_cat_id
@@ -37,7 +37,6 @@ Custom Dependencies:
     app.sql_db:
         DatabaseContext: Context manager for database operations.
         VideoManager: Manages videos.
-        CategoryManager: Manages categories.
         TagManager: Manages tags.
         LocationManager: Manages locations.
         SpeakerManager: Manages speakers.
@@ -76,7 +75,6 @@ import logging
 from app.sql_db import (
     DatabaseContext,
     VideoManager,
-    CategoryManager,
     TagManager,
     LocationManager,
     SpeakerManager,
@@ -256,13 +254,12 @@ def video_details(
         If the video is not found, a 404 error is returned.
     """
 
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         video_mgr = VideoManager(db)
-        cat_mgr = CategoryManager(db)
 
-        # Fetch the video details (returned as a list)
-        video_list = video_mgr.get(video_id)
-        if not video_list:
+        # Fetch the video with all its related items in one query
+        video = video_mgr.get_full(video_id)
+        if not video:
             return make_response(
                 render_template(
                     "404.html",
@@ -270,42 +267,14 @@ def video_details(
                 ),
                 404
             )
-        video = video_list[0]
 
-        # Fetch the category name for the video
-        cat_list = cat_mgr.get_from_video(
-            video_id=video_id
-        )
-
-        # Fetch tags for the video
-        tag_mgr = TagManager(db)
-        tags = tag_mgr.get_from_video(
-            video_id=video_id
-        )
-
-        # Fetch locations for the video
-        loc_mgr = LocationManager(db)
-        locations = loc_mgr.get_from_video(
-            video_id=video_id
-        )
-
-        # Fetch speakers for the video
-        speaker_mgr = SpeakerManager(db)
-        speakers = speaker_mgr.get_from_video(
-            video_id=video_id
-        )
-
-        # Fetch characters for the video
-        character_mgr = CharacterManager(db)
-        characters = character_mgr.get_from_video(
-            video_id=video_id
-        )
-
-        # Fetch scriptures for the video
-        scripture_mgr = ScriptureManager(db)
-        scriptures = scripture_mgr.get_from_video(
-            video_id=video_id
-        )
+    # Separate the related items from the video details
+    cat_list = video.pop("categories")
+    tags = video.pop("tags")
+    locations = video.pop("locations")
+    speakers = video.pop("speakers")
+    characters = video.pop("characters")
+    scriptures = video.pop("scriptures")
 
     # Check if the video is marked as watched by the user, or in progress
     current_time = 0
@@ -328,7 +297,7 @@ def video_details(
             current_time = in_progress[0]['current_time'] if in_progress else 0
 
     # Get similar videos
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         similarity_mgr = SimilarityManager(db)
         similar_videos = similarity_mgr.get(
             video1_id=video_id,
@@ -348,7 +317,7 @@ def video_details(
         else:
             id = similar['video_1_id']
 
-        with DatabaseContext() as db:
+        with DatabaseContext(read_only=True) as db:
             video_mgr = VideoManager(db)
             video_details = video_mgr.get(id)
             if video_details:
@@ -451,7 +420,7 @@ def tag_details(
         If the tag is not found, a 404 error is returned.
     """
 
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         tag_mgr = TagManager(db)
         video_mgr = VideoManager(db)
 
@@ -503,7 +472,7 @@ def location_details(
         If the location is not found, a 404 error is returned.
     """
 
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         loc_mgr = LocationManager(db)
         video_mgr = VideoManager(db)
 
@@ -555,7 +524,7 @@ def speaker_details(
         If the speaker is not found, a 404 error is returned.
     """
 
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         speaker_mgr = SpeakerManager(db)
         video_mgr = VideoManager(db)
 
@@ -609,7 +578,7 @@ def character_details(
 
     PIC_PATH = "/static/img/characters/"
 
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         character_mgr = CharacterManager(db)
         video_mgr = VideoManager(db)
 
@@ -663,7 +632,7 @@ def scripture_details(
         If the scripture is not found, a 404 error is returned.
     """
 
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         scripture_mgr = ScriptureManager(db)
         video_mgr = VideoManager(db)
 
@@ -887,7 +856,7 @@ def advanced_search() -> Response:
         Rendered advanced search template with metadata options and results.
     """
 
-    with DatabaseContext() as db:
+    with DatabaseContext(read_only=True) as db:
         # Get speakers
         speaker_mgr = SpeakerManager(db)
         speakers = speaker_mgr.get() or []
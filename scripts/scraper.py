@@ -1040,9 +1040,18 @@ class BuildDb:
             video_manager = VideoManager(db)
             update = False
 
+            # Look up all the missing videos in one query
+            found = video_manager.names_to_ids(
+                [
+                    row['video_name']
+                    for _, row in self.videos.iterrows()
+                    if not row['exist']
+                ]
+            ) or {}
+
             for idx, row in self.videos.iterrows():
                 if not row['exist']:
-                    exists = video_manager.name_to_id(row['video_name'])
+                    exists = found.get(row['video_name'])
                     if exists:
                         update = True
                         # Use boolean mask for safer indexing
@@ -38,12 +38,6 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from app.sql_db import (    # noqa: E402
     DatabaseContext,
     VideoManager,
-    CategoryManager,
-    TagManager,
-    LocationManager,
-    SpeakerManager,
-    ScriptureManager,
-    CharacterManager,
     SimilarityManager,
 )
 
@@ -193,113 +187,49 @@ class Similarity:
 
         with DatabaseContext() as db:
             video_mgr = VideoManager(db)
-            cat_mgr = CategoryManager(db)
-            tag_mgr = TagManager(db)
-            location_mgr = LocationManager(db)
-            speaker_mgr = SpeakerManager(db)
-            scripture_mgr = ScriptureManager(db)
-            character_mgr = CharacterManager(db)
 
             for video in (self.video1, self.video2):
-                # Get the video entry
-                video_entry = video_mgr.get(video['id'])
+                # Get the video entry and everything linked to it
+                #   One query, rather than one per kind of item
+                video_entry = video_mgr.get_full(video['id'])
                 if not video_entry:
                     raise ValueError(
                         f"Video with ID {video['id']} "
                         f"not found in the database."
                     )
 
-                # Convert list to single item if necessary
-                video_entry = (
-                    video_entry[0]
-                    if isinstance(video_entry, list)
-                    else video_entry
-                )
-
                 # Store the video metadata
                 video['name'] = video_entry.get('name', '')
                 video['description'] = video_entry.get('description', '')
 
-                # Get categories
-                categories = cat_mgr.get_from_video(
-                    video_id=video['id']
-                )
-                if categories is not None:
-                    categories = [
-                        category['name']
-                        for category in categories
-                        if 'name' in category
-                    ]
-                    video['categories'] = categories
-
-                # Get tags
-                tags = tag_mgr.get_from_video(
-                    video_id=video['id']
-                )
-                if tags is not None:
-                    tags = [tag['name'] for tag in tags if 'name' in tag]
-                    video['tags'] = tags
-                else:
-                    video['tags'] = []
-
-                # Get location
-                location = location_mgr.get_from_video(
-                    video_id=video['id']
-                )
-                if location is not None:
-                    location = [
-                        location['name']
-                        for location in location
-                        if 'name' in location
-                    ]
-                    video['location'] = location
-                else:
-                    video['location'] = []
-
-                # Get speakers
-                speakers = speaker_mgr.get_from_video(
-                    video_id=video['id']
-                )
-                if speakers is not None:
-                    speakers = [
-                        speaker['name']
-                        for speaker in speakers
-                        if 'name' in speaker
-                    ]
-                    video['speakers'] = speakers
-                else:
-                    video['speakers'] = []
-
-                # Get scriptures
-                scriptures = scripture_mgr.get_from_video(
-                    video_id=video['id']
-                )
-                if scriptures is not None:
-                    scriptures = [
-                        {
-                            k: v for k,
-                            v in scripture.items()
-                            if k not in ('id', 'verse_text')
-                        }
-                        for scripture in scriptures
-                    ]
-                    video['scriptures'] = scriptures
-                else:
-                    video['scriptures'] = []
-
-                # Get characters
-                characters = character_mgr.get_from_video(
-                    video_id=video['id']
-                )
-                if characters is not None:
-                    characters = [
-                        character['name']
-                        for character in characters
-                        if 'name' in character
-                    ]
-                    video['characters'] = characters
-                else:
-                    video['characters'] = []
+                # Store the names of the categories, tags, etc
+                video['categories'] = [
+                    category['name']
+                    for category in video_entry['categories']
+                ]
+                video['tags'] = [tag['name'] for tag in video_entry['tags']]
+                video['location'] = [
+                    location['name']
+                    for location in video_entry['locations']
+                ]
+                video['speakers'] = [
+                    speaker['name']
+                    for speaker in video_entry['speakers']
+                ]
+                video['characters'] = [
+                    character['name']
+                    for character in video_entry['characters']
+                ]
+
+                # Scriptures are compared by reference, not by ID or text
+                video['scriptures'] = [
+                    {
+                        k: v for k,
+                        v in scripture.items()
+                        if k not in ('id', 'verse_text')
+                    }
+                    for scripture in video_entry['scriptures']
+                ]
 
     def _jaccard(
         self,
@@ -579,7 +509,7 @@ class SimScraper:
 
         with DatabaseContext() as db:
             video_mgr = VideoManager(db)
-            video_list = video_mgr.get()
+            video_list = video_mgr.get(columns=("id",))
 
         # Convert to list of IDs
         if video_list:
@@ -661,7 +591,8 @@ class SimScraper:
                             )
 
             # Write the top 10 similarities for the current video
-            with DatabaseContext() as db:
+            #   All rows are committed together when the context exits
+            with DatabaseContext(autocommit=False) as db:
                 sim_mgr = SimilarityManager(db)
 
                 for item in top_10:
@@ -264,19 +264,15 @@ class ElasticsearchIndexer:
             )
             transcript_data = VTTParser.parse_vtt_file(subtitle_path)
 
-            # Fetch related data using managers
-            with DatabaseContext() as db:
-                tag_mgr = TagManager(db)
-                speaker_mgr = SpeakerManager(db)
-                char_mgr = CharacterManager(db)
-                loc_mgr = LocationManager(db)
-                scripture_mgr = ScriptureManager(db)
-
-                tags = tag_mgr.get_from_video(video_id)
-                speakers = speaker_mgr.get_from_video(video_id)
-                characters = char_mgr.get_from_video(video_id)
-                locations = loc_mgr.get_from_video(video_id)
-                scriptures = scripture_mgr.get_from_video(video_id)
+            # Fetch related data in one query
+            with DatabaseContext(read_only=True) as db:
+                related = VideoManager(db).get_full(video_id) or {}
+
+            tags = related.get('tags')
+            speakers = related.get('speakers')
+            characters = related.get('characters')
+            locations = related.get('locations')
+            scriptures = related.get('scriptures')
 
             # Prepare document for indexing
             #   Map database field 'name' to ES field 'title'
@@ -362,6 +358,24 @@ class ElasticsearchIndexer:
 
         stats = {'success': 0, 'failed': 0}
 
+        # Fetch related data for every video up front, one query per
+        #   table, rather than five queries for each video
+        video_ids = [video['id'] for video in videos if video.get('id')]
+        with DatabaseContext(read_only=True) as db:
+            tags_by_video = TagManager(db).get_from_videos(video_ids) or {}
+            speakers_by_video = (
+                SpeakerManager(db).get_from_videos(video_ids) or {}
+            )
+            characters_by_video = (
+                CharacterManager(db).get_from_videos(video_ids) or {}
+            )
+            locations_by_video = (
+                LocationManager(db).get_from_videos(video_ids) or {}
+            )
+            scriptures_by_video = (
+                ScriptureManager(db).get_from_videos(video_ids) or {}
+            )
+
         def generate_actions() -> Generator[Dict[str, Any], None, None]:
             """
             Generator for bulk indexing actions.
@@ -395,19 +409,12 @@ class ElasticsearchIndexer:
                 )
                 transcript_data = VTTParser.parse_vtt_file(subtitle_path)
 
-                # Fetch related data using managers
-                with DatabaseContext() as db:
-                    tag_mgr = TagManager(db)
-                    speaker_mgr = SpeakerManager(db)
-                    char_mgr = CharacterManager(db)
-                    loc_mgr = LocationManager(db)
-                    scripture_mgr = ScriptureManager(db)
-
-                    tags = tag_mgr.get_from_video(video_id)
-                    speakers = speaker_mgr.get_from_video(video_id)
-                    characters = char_mgr.get_from_video(video_id)
-                    locations = loc_mgr.get_from_video(video_id)
-                    scriptures = scripture_mgr.get_from_video(video_id)
+                # Related data was fetched in bulk above
+                tags = tags_by_video.get(video_id, [])
+                speakers = speakers_by_video.get(video_id, [])
+                characters = characters_by_video.get(video_id, [])
+                locations = locations_by_video.get(video_id, [])
+                scriptures = scriptures_by_video.get(video_id, [])
 
                 document = {
                     'video_id': video_id,
@@ -520,7 +527,7 @@ class ElasticsearchIndexer:
             return {'success': 0, 'failed': 0}
 
         # Fetch all videos using VideoManager
-        with DatabaseContext() as db:
+        with DatabaseContext(read_only=True) as db:
             video_mgr = VideoManager(db)
             videos = video_mgr.get()
 
@@ -24,6 +24,7 @@ Local dependencies:
 
 # Standard library imports
 import logging
+import sqlite3
 from typing import (
     Dict,
     List,
@@ -135,7 +136,7 @@ class SearchService:
         """
 
         try:
-            with DatabaseContext() as db:
+            with DatabaseContext(read_only=True) as db:
                 # Get the video
                 video_mgr = VideoManager(db)
                 videos = video_mgr.get(id=int(video_id))
@@ -411,23 +412,23 @@ class SearchService:
             Tuple of (List of search results, Total count).
         """
 
-        with DatabaseContext() as db:
+        with DatabaseContext(read_only=True) as db:
             video_mgr = VideoManager(db)
 
-            # Get all videos and filter in memory (basic fallback)
-            all_videos = video_mgr.get() or []
-
-            logger.debug(
-                f"Database has {len(all_videos)} total videos"
-            )
-
-            # Filter by query
+            # Filter by query in memory (basic fallback)
+            #   Videos are streamed from the database as they're checked,
+            #   so only the matches are held in memory
             query_lower = query.lower()
-            filtered = [
-                v for v in all_videos
-                if (query_lower in v.get('name', '').lower() or
-                    query_lower in v.get('description', '').lower())
-            ]
+            try:
+                filtered = [
+                    v for v in video_mgr.get_iter()
+                    if (query_lower in v.get('name', '').lower() or
+                        query_lower in v.get('description', '').lower())
+                ]
+
+            except sqlite3.Error as e:
+                logger.error(f"Database search error: {e}")
+                filtered = []
 
             logger.debug(
                 f"After filtering by query '{query}': "